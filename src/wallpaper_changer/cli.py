@@ -64,6 +64,8 @@ def watch_cmd(config: str | None) -> None:
     try:
         while True:
             schedule.run_pending()
-            time.sleep(1)
+            # Dorme ate o proximo job em vez de acordar a cada 1s;
+            # Ctrl+C interrompe o sleep imediatamente no main thread.
+            time.sleep(max(schedule.idle_seconds() or interval, 0.1))
     except KeyboardInterrupt:
         click.echo("\n[INFO] Encerrado.")
@@ -1,6 +1,7 @@
 """Leitura, validacao e persistencia das configuracoes do projeto."""
 from __future__ import annotations
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 if sys.version_info >= (3, 11):
@@ -24,16 +25,23 @@ def get_project_root() -> Path:
     return PROJECT_ROOT
 
 
+@lru_cache(maxsize=64)
+def _resolve_cached(raw: str, base: Path) -> Path:
+    return (base / raw).resolve()
+
+
 def resolve_path(raw: str | Path, root: Path | None = None) -> Path:
     """
     Resolve um caminho relativo ou absoluto.
     Caminhos relativos sao resolvidos a partir de `root` (default: PROJECT_ROOT).
+    Resolucoes repetidas da mesma entrada saem de um cache (resolve() faz
+    syscalls no Windows).
     """
     p = Path(raw)
     if p.is_absolute():
         return p
     base = root if root is not None else PROJECT_ROOT
-    return (base / p).resolve()
+    return _resolve_cached(str(raw), base)
 
 
 def load_config(path: Path | None = None) -> dict:
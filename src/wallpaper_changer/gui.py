@@ -2,14 +2,14 @@
 from __future__ import annotations
 
 import ctypes
+import queue
 import threading
-import time
 import tkinter as tk
+from contextlib import contextmanager
 from pathlib import Path
 from tkinter import filedialog, messagebox
 
 import pystray
-import schedule
 import ttkbootstrap as ttk
 from PIL import Image as PILImage, ImageDraw
 from ttkbootstrap.constants import *
@@ -17,6 +17,7 @@ from ttkbootstrap.constants import *
 from .config import load_config, save_config, resolve_path
 from .hotkeys import HotkeyManager, read_hotkey, is_available as hotkeys_available
 from .i18n import t, set_language, get_language, SUPPORTED_LANGUAGES
+from .image_utils import list_images_sorted_by_date
 from .monitor import Monitor, get_monitors
 from .startup import is_startup_enabled, is_startup_launch, set_startup_enabled
 from .wallpaper import apply_wallpaper, apply_single_wallpaper
@@ -34,8 +35,28 @@ _MON_COLORS = ["#3a7bd5", "#e05252", "#3dba5a", "#d4a027", "#9b59b6"]
 _BG_CANVAS  = "#1a1a2e"
 _ACCENT     = "#3a7bd5"
 
+# Fontes compartilhadas — um unico tuple reutilizado por todos os widgets
+_FONT_SMALL = ("Segoe UI", 9)
+_FONT_BODY  = ("Segoe UI", 10)
+_FONT_VALUE = ("Segoe UI", 11, "bold")
+
 # Fit mode keys — labels are resolved via i18n at build time
-_FIT_KEYS = ["fill", "fit", "stretch", "center", "span"]
+_FIT_KEYS = ("fill", "fit", "stretch", "center", "span")
+_FIT_COLS = tuple(range(len(_FIT_KEYS)))
+_FIT_N = len(_FIT_KEYS)
+
+
+def _lighten(col: str, delta: int = 55) -> str:
+    """Clareia uma cor ``#rrggbb`` somando *delta* por canal (com saturacao)."""
+    rgb = int(col[1:], 16)
+    r = min(0xFF, (rgb >> 16) + delta)
+    g = min(0xFF, (rgb >> 8 & 0xFF) + delta)
+    b = min(0xFF, (rgb & 0xFF) + delta)
+    return f"#{r << 16 | g << 8 | b:06x}"
+
+
+# Versao clareada da paleta, resolvida uma unica vez no import
+_LIGHT_COLORS = [_lighten(c) for c in _MON_COLORS]
 
 
 def _fit_label(key: str) -> str:
@@ -84,7 +105,7 @@ class WallpaperChangerApp(ttk.Window):
 
         self._monitors: list[Monitor] = []
         self._watching = False
-        self._watch_thr: threading.Thread | None = None
+        self._watch_job: str | None = None
         self._tray_icon: pystray.Icon | None = None
         self._startup_launch = is_startup_launch()
 
@@ -103,7 +124,16 @@ class WallpaperChangerApp(ttk.Window):
 
         self._fit_btns: dict[str, ttk.Button] = {}
         self._collage_btns: dict[int, ttk.Button] = {}
-        self._draw_after_id: str | None = None  # debounce for monitor redraw
+        self._redraw_pending = False  # coalesce monitor redraws (~60 Hz)
+
+        # Persistent canvas items for the monitor preview — reused across
+        # redraws via coords/itemconfigure instead of delete("all").
+        self._mon_items: list[dict[str, int]] = []
+        self._mon_bg: int | None = None
+        self._mon_empty: int | None = None
+        self._mon_items_n: int | None = None
+        self._last_canvas_size: tuple[int, int] = (0, 0)
+        self._last_monitor_sig: tuple = ()
 
         # ── Hotkey variables ──────────────────────────────────────────────────
         hk = self._cfg.get("hotkeys", {})
@@ -116,6 +146,12 @@ class WallpaperChangerApp(ttk.Window):
             value=self._cfg.get("paths", {}).get("default_wallpaper", ""),
         )
 
+        # Snapshot de _collect_config; invalidado via trace nas variaveis Tk
+        self._cfg_cache: dict | None = None
+
+        # Output dir memoizado: (valor bruto do config, Path resolvido+criado)
+        self._out_dir_cache: tuple[str, Path] | None = None
+
         # ── Wallpaper history (in-session) ────────────────────────────────────
         self._wp_history: list[list[str]] = []
         self._wp_hist_idx: int = -1
@@ -129,9 +165,19 @@ class WallpaperChangerApp(ttk.Window):
         self._pynput_mouse_listener = None
         self._pynput_kb_listener = None
         self._alt_pressed = False
+        # Atualizacao de status coalescida do Alt+Scroll — uma rajada de ticks
+        # vira um unico after() pendente em vez de inundar a fila do Tk
+        self._pending_status_alpha: int | None = None
+        self._pending_status_hwnd: int = 0
+        self._status_flush_pending = False
+
+        # ── Worker unico de aplicacao (coalesce cliques/ticks sobrepostos) ───
+        self._apply_q: queue.Queue[dict] = queue.Queue(maxsize=1)
+        threading.Thread(target=self._apply_worker, daemon=True).start()
 
         # ── Construcao da UI ──────────────────────────────────────────────────
         self._build_ui()
+        self._watch_cfg_vars()
         self._setup_tray()
         self._refresh_monitors()
         self.after(200, self._draw_monitors)
@@ -247,11 +293,11 @@ class WallpaperChangerApp(ttk.Window):
 
         ttk.Label(
             hdr, text=t("header_subtitle"),
-            font=("Segoe UI", 10), foreground="gray", anchor=W,
+            font=_FONT_BODY, foreground="gray", anchor=W,
         ).grid(row=1, column=1, sticky=W)
 
         self._lbl_mon_count = ttk.Label(
-            hdr, text=t("detecting"), font=("Segoe UI", 10), foreground="gray",
+            hdr, text=t("detecting"), font=_FONT_BODY, foreground="gray",
         )
         self._lbl_mon_count.grid(row=0, column=2, rowspan=2, padx=(12, 0))
 
@@ -325,7 +371,10 @@ class WallpaperChangerApp(ttk.Window):
     def _build_fit_section(self, parent: ttk.Frame) -> None:
         frame = ttk.Labelframe(parent, text=t("fit_title"), padding=10)
         frame.grid(row=4, column=0, sticky=EW, padx=12, pady=4)
-        frame.columnconfigure(tuple(range(len(_FIT_KEYS))), weight=1)
+        frame.columnconfigure(_FIT_COLS, weight=1)
+
+        # Resolve labels/descriptions once — t() + format per click adds up
+        self._fit_descs = {k: _fit_desc(k) for k in _FIT_KEYS}
 
         for ci, fkey in enumerate(_FIT_KEYS):
             btn = ttk.Button(
@@ -336,9 +385,9 @@ class WallpaperChangerApp(ttk.Window):
             self._fit_btns[fkey] = btn
 
         self._fit_desc = ttk.Label(
-            frame, text="", font=("Segoe UI", 9), foreground="gray",
+            frame, text="", font=_FONT_SMALL, foreground="gray",
         )
-        self._fit_desc.grid(row=1, column=0, columnspan=len(_FIT_KEYS), sticky=W, pady=(6, 0))
+        self._fit_desc.grid(row=1, column=0, columnspan=_FIT_N, sticky=W, pady=(6, 0))
 
         self._select_fit(self._fit_var.get())
 
@@ -352,8 +401,10 @@ class WallpaperChangerApp(ttk.Window):
         row1.grid(row=0, column=0, sticky=W)
 
         ttk.Label(row1, text=t("interval_label")).pack(side=LEFT, padx=(0, 6))
+        vcmd = (self.register(self._validate_interval), "%P")
         ttk.Entry(
             row1, textvariable=self._interval_var, width=8, justify=CENTER,
+            validate="key", validatecommand=vcmd,
         ).pack(side=LEFT)
         ttk.Label(row1, text=" " + t("seconds")).pack(side=LEFT)
 
@@ -397,7 +448,7 @@ class WallpaperChangerApp(ttk.Window):
             ttk.Label(
                 frame,
                 text=t("hk_disabled_warning"),
-                font=("Segoe UI", 9), foreground="#e74c3c",
+                font=_FONT_SMALL, foreground="#e74c3c",
             ).grid(row=len(labels), column=0, columnspan=3, sticky=W, pady=(6, 0))
 
     # ── Default Wallpaper Section ─────────────────────────────────────────────
@@ -417,7 +468,7 @@ class WallpaperChangerApp(ttk.Window):
             sel_row,
             textvariable=self._transp_combo_var,
             state="readonly",
-            font=("Segoe UI", 10),
+            font=_FONT_BODY,
         )
         self._transp_combo.grid(row=0, column=0, sticky=EW, padx=(0, 8))
         self._transp_combo.bind("<<ComboboxSelected>>", self._on_transp_window_selected)
@@ -445,7 +496,7 @@ class WallpaperChangerApp(ttk.Window):
         self._transp_slider.grid(row=0, column=0, sticky=EW, padx=(0, 8))
 
         self._transp_opacity_label = ttk.Label(
-            slider_row, text="255", font=("Segoe UI", 11, "bold"),
+            slider_row, text="255", font=_FONT_VALUE,
             width=4, anchor="center",
         )
         self._transp_opacity_label.grid(row=0, column=1)
@@ -453,7 +504,7 @@ class WallpaperChangerApp(ttk.Window):
         # ── Shortcut hints ────────────────────────────────────────────────
         ttk.Label(
             frame, text=t("transp_shortcut_info"),
-            font=("Segoe UI", 9), foreground="gray",
+            font=_FONT_SMALL, foreground="gray",
         ).grid(row=2, column=0, sticky=W)
 
         # Populate on build
@@ -582,10 +633,13 @@ class WallpaperChangerApp(ttk.Window):
                 # Persist on scroll, though might be a bit chatty
                 self._save_transparency_settings()
 
-                self.after(0, lambda a=new_alpha: self._set_status(
-                    t("transp_applied", alpha=a),
-                ))
-                self.after(0, self._sync_transp_slider_if_match, hwnd)
+                # Coalesce: guarda so o ultimo valor e agenda um unico flush
+                # por janela de 50 ms (uma roda rapida emite dezenas de ticks)
+                self._pending_status_alpha = new_alpha
+                self._pending_status_hwnd = hwnd
+                if not self._status_flush_pending:
+                    self._status_flush_pending = True
+                    self.after(50, self._flush_transp_status)
 
             self._pynput_kb_listener = pynput_kb.Listener(
                 on_press=on_press, on_release=on_release,
@@ -600,6 +654,14 @@ class WallpaperChangerApp(ttk.Window):
         except Exception:
             pass
 
+    def _flush_transp_status(self) -> None:
+        self._status_flush_pending = False
+        alpha, self._pending_status_alpha = self._pending_status_alpha, None
+        if alpha is None:
+            return
+        self._set_status(t("transp_applied", alpha=alpha))
+        self._sync_transp_slider_if_match(self._pending_status_hwnd)
+
     def _sync_transp_slider_if_match(self, hwnd: int) -> None:
         """If the given hwnd matches the combo selection, update the slider."""
         selected = self._transp_selected_hwnd()
@@ -618,7 +680,7 @@ class WallpaperChangerApp(ttk.Window):
         ttk.Label(
             frame,
             text=t("default_wp_desc"),
-            font=("Segoe UI", 9), foreground="gray",
+            font=_FONT_SMALL, foreground="gray",
         ).grid(row=0, column=0, columnspan=2, sticky=W, pady=(0, 6))
 
         entry = ttk.Entry(frame, textvariable=self._default_wp_var)
@@ -638,7 +700,7 @@ class WallpaperChangerApp(ttk.Window):
         ttk.Label(
             frame,
             text=t("folder_formats"),
-            font=("Segoe UI", 9), foreground="gray",
+            font=_FONT_SMALL, foreground="gray",
         ).grid(row=0, column=0, columnspan=2, sticky=W, pady=(0, 6))
 
         raw = self._cfg["paths"]["wallpapers_folder"]
@@ -654,7 +716,7 @@ class WallpaperChangerApp(ttk.Window):
         ).grid(row=1, column=1)
 
         self._folder_info = ttk.Label(
-            frame, text="", font=("Segoe UI", 9), foreground="gray",
+            frame, text="", font=_FONT_SMALL, foreground="gray",
         )
         self._folder_info.grid(row=2, column=0, columnspan=2, sticky=W, pady=(6, 0))
 
@@ -671,7 +733,8 @@ class WallpaperChangerApp(ttk.Window):
         tree_scroll.grid(row=3, column=2, sticky="ns", pady=(6, 0))
         self._img_tree.configure(yscrollcommand=tree_scroll.set)
 
-        self._update_folder_info()
+        # Defer the first folder scan so the window maps before any disk work
+        self.after(200, self._update_folder_info)
 
     # ── Language Section ──────────────────────────────────────────────────────
     def _build_language_section(self, parent: ttk.Frame) -> None:
@@ -693,7 +756,7 @@ class WallpaperChangerApp(ttk.Window):
             self._lang_btns[code] = rb
 
         self._lang_note = ttk.Label(
-            frame, text="", font=("Segoe UI", 9), foreground="gray",
+            frame, text="", font=_FONT_SMALL, foreground="gray",
         )
         self._lang_note.grid(row=1, column=0, columnspan=2, sticky=W, pady=(6, 0))
 
@@ -744,7 +807,7 @@ class WallpaperChangerApp(ttk.Window):
         bar.pack(side=BOTTOM, fill=X)
 
         self._status_lbl = ttk.Label(
-            bar, text=t("ready"), font=("Segoe UI", 9), foreground="gray",
+            bar, text=t("ready"), font=_FONT_SMALL, foreground="gray",
         )
         self._status_lbl.pack(side=LEFT)
 
@@ -767,8 +830,7 @@ class WallpaperChangerApp(ttk.Window):
                 btn.configure(style="primary.TButton")
             else:
                 btn.configure(style="Outline.TButton")
-        desc = _fit_desc(key)
-        self._fit_desc.configure(text=desc)
+        self._fit_desc.configure(text=self._fit_descs[key])
 
     def _on_startup_toggle(self) -> None:
         try:
@@ -806,35 +868,40 @@ class WallpaperChangerApp(ttk.Window):
         self._folder_info.configure(text=t("folder_scanning"), foreground="gray")
 
         def _scan() -> None:
-            from .image_utils import list_images_sorted_by_date
-            images = list_images_sorted_by_date(folder)
+            images, total = list_images_sorted_by_date(folder, limit=100)
             # Schedule UI update back on the main thread
-            self.after(0, lambda: self._populate_folder_tree(images))
+            self.after(0, lambda: self._populate_folder_tree(images, total))
 
         threading.Thread(target=_scan, daemon=True).start()
 
-    def _populate_folder_tree(self, images: list[Path]) -> None:
+    def _populate_folder_tree(self, images: list[Path], total: int) -> None:
         """Populate the folder treeview with scan results (runs on main thread)."""
         for item in self._img_tree.get_children():
             self._img_tree.delete(item)
 
-        count = len(images)
         self._folder_info.configure(
-            text=t("folder_images_found", n=count), foreground="gray",
+            text=t("folder_images_found", n=total), foreground="gray",
         )
 
-        for i, img_path in enumerate(images[:100]):
+        for i, img_path in enumerate(images):
             self._img_tree.insert("", END, values=(f"{i+1:03d}  {img_path.name}",))
 
-        if count > 100:
-            self._img_tree.insert("", END, values=(t("folder_more_images", n=count - 100),))
+        if total > len(images):
+            self._img_tree.insert(
+                "", END, values=(t("folder_more_images", n=total - len(images)),),
+            )
 
     # ── Monitor Preview ───────────────────────────────────────────────────────
     def _schedule_draw_monitors(self) -> None:
-        """Debounce: delay the monitor redraw so rapid Configure events coalesce."""
-        if self._draw_after_id is not None:
-            self.after_cancel(self._draw_after_id)
-        self._draw_after_id = self.after(50, self._draw_monitors)
+        """Coalesce: rapid Configure events trigger at most one redraw per ~frame."""
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        self.after(16, self._flush_redraw)
+
+    def _flush_redraw(self) -> None:
+        self._redraw_pending = False
+        self._draw_monitors()
 
     def _refresh_monitors(self) -> None:
         try:
@@ -847,27 +914,65 @@ class WallpaperChangerApp(ttk.Window):
         self._lbl_mon_count.configure(text=t("monitors_count", n=n))
         self._draw_monitors()
 
+    def _rebuild_monitor_items(self, n: int) -> None:
+        """Recreate the canvas item pool — only when the monitor count changes."""
+        c = self._mon_canvas
+        c.delete("all")
+        self._mon_bg = c.create_rectangle(0, 0, 0, 0, fill=_BG_CANVAS, outline="")
+        self._mon_empty = None
+        self._mon_items = []
+        if n == 0:
+            self._mon_empty = c.create_text(
+                0, 0, text=t("no_monitor_detected"),
+                fill="#555", font=("Segoe UI", 11),
+            )
+        else:
+            for _ in range(n):
+                self._mon_items.append({
+                    "shadow": c.create_rectangle(0, 0, 0, 0, fill="#000", outline=""),
+                    "body": c.create_rectangle(0, 0, 0, 0, outline="#666", width=1),
+                    "light": c.create_rectangle(0, 0, 0, 0, outline=""),
+                    "label": c.create_text(0, 0, fill="white"),
+                    "res": c.create_text(0, 0, fill="#ccc"),
+                })
+        self._mon_items_n = n
+
     def _draw_monitors(self) -> None:
         c = self._mon_canvas
         try:
-            c.delete("all")
             cw = c.winfo_width() or 720
             ch = c.winfo_height() or 130
-            c.create_rectangle(0, 0, cw, ch, fill=_BG_CANVAS, outline="")
+
+            # <Configure> dispara por motivos alem de resize; nada mudou → sai
+            sig = tuple(
+                (m.index, m.x, m.y, m.width, m.height) for m in self._monitors
+            )
+            if (cw, ch) == self._last_canvas_size and sig == self._last_monitor_sig:
+                return
+            self._last_canvas_size = (cw, ch)
+            self._last_monitor_sig = sig
+
+            n = len(self._monitors)
+            if self._mon_items_n != n:
+                self._rebuild_monitor_items(n)
+
+            c.coords(self._mon_bg, 0, 0, cw, ch)
         except tk.TclError:
             return
 
         if not self._monitors:
-            c.create_text(
-                cw // 2, ch // 2, text=t("no_monitor_detected"),
-                fill="#555", font=("Segoe UI", 11),
-            )
+            c.coords(self._mon_empty, cw // 2, ch // 2)
             return
 
-        min_x = min(m.x for m in self._monitors)
-        min_y = min(m.y for m in self._monitors)
-        max_x = max(m.x + m.width for m in self._monitors)
-        max_y = max(m.y + m.height for m in self._monitors)
+        # Bounds do desktop virtual em uma unica passada
+        first = self._monitors[0]
+        min_x, min_y = first.x, first.y
+        max_x, max_y = first.x + first.width, first.y + first.height
+        for m in self._monitors[1:]:
+            min_x = min(min_x, m.x)
+            min_y = min(min_y, m.y)
+            max_x = max(max_x, m.x + m.width)
+            max_y = max(max_y, m.y + m.height)
         vd_w = max_x - min_x or 1
         vd_h = max_y - min_y or 1
         pad = 14
@@ -875,101 +980,139 @@ class WallpaperChangerApp(ttk.Window):
         ox = pad + (cw - pad * 2 - vd_w * scale) / 2
         oy = pad + (ch - pad * 2 - vd_h * scale) / 2
 
-        for m in self._monitors:
-            col = _MON_COLORS[m.index % len(_MON_COLORS)]
+        for m, items in zip(self._monitors, self._mon_items):
+            ci = m.index % len(_MON_COLORS)
+            col = _MON_COLORS[ci]
             x1 = ox + (m.x - min_x) * scale
             y1 = oy + (m.y - min_y) * scale
             x2 = x1 + m.width * scale
             y2 = y1 + m.height * scale
 
-            # Shadow
-            c.create_rectangle(x1 + 3, y1 + 3, x2 + 3, y2 + 3, fill="#000", outline="")
-            # Background
-            c.create_rectangle(x1, y1, x2, y2, fill=col, outline="#666", width=1)
-            # Top bar highlight
-            ri, gi, bi = int(col[1:3], 16), int(col[3:5], 16), int(col[5:7], 16)
-            light = "#{:02x}{:02x}{:02x}".format(
-                min(255, ri + 55), min(255, gi + 55), min(255, bi + 55),
-            )
-            c.create_rectangle(x1, y1, x2, y1 + (y2 - y1) * 0.3, fill=light, outline="")
-
             fs = max(8, int((x2 - x1) * 0.14))
             cx_m = (x1 + x2) / 2
             cy_m = (y1 + y2) / 2
-            c.create_text(
-                cx_m, cy_m - fs, text=f"M{m.index + 1}",
-                fill="white", font=("Segoe UI", fs, "bold"),
+
+            c.coords(items["shadow"], x1 + 3, y1 + 3, x2 + 3, y2 + 3)
+            c.coords(items["body"], x1, y1, x2, y2)
+            c.itemconfigure(items["body"], fill=col)
+            c.coords(items["light"], x1, y1, x2, y1 + (y2 - y1) * 0.3)
+            c.itemconfigure(items["light"], fill=_LIGHT_COLORS[ci])
+            c.coords(items["label"], cx_m, cy_m - fs)
+            c.itemconfigure(
+                items["label"], text=f"M{m.index + 1}",
+                font=("Segoe UI", fs, "bold"),
             )
-            c.create_text(
-                cx_m, cy_m + fs * 0.6, text=f"{m.width}x{m.height}",
-                fill="#ccc", font=("Segoe UI", max(7, fs - 2)),
+            c.coords(items["res"], cx_m, cy_m + fs * 0.6)
+            c.itemconfigure(
+                items["res"], text=f"{m.width}x{m.height}",
+                font=("Segoe UI", max(7, fs - 2)),
             )
 
+    @staticmethod
+    def _validate_interval(proposed: str) -> bool:
+        """validatecommand: aceita vazio (durante a edicao) ou inteiro >= 1."""
+        return not proposed or (proposed.isdigit() and int(proposed) >= 1)
+
     # ── Config collect ────────────────────────────────────────────────────────
+    def _watch_cfg_vars(self) -> None:
+        """Invalida o snapshot de config quando qualquer variavel Tk muda."""
+        for var in (
+            self._fit_var, self._sel_var, self._interval_var,
+            self._collage_count_var, self._collage_same_var, self._lang_var,
+            self._hk_next_var, self._hk_prev_var, self._hk_stop_var,
+            self._hk_default_var, self._hk_transp_var,
+            self._default_wp_var, self._folder_var,
+        ):
+            var.trace_add("write", self._mark_cfg_dirty)
+
+    def _mark_cfg_dirty(self, *_args) -> None:
+        self._cfg_cache = None
+
     def _collect_config(self) -> dict:
+        if self._cfg_cache is not None:
+            return self._cfg_cache
+        # A Entry valida por tecla (_validate_interval), mas a var tambem e
+        # semeada direto do settings.toml — um valor nao inteiro la ainda
+        # precisa do fallback.
         try:
             interval = max(1, int(self._interval_var.get() or "300"))
         except ValueError:
             interval = 300
 
-        return {
-            "_config_path": self._cfg.get("_config_path", ""),
-            "general": {
-                "mode": "collage",
-                "selection": self._sel_var.get(),
-                "interval": interval,
-                "collage_count": int(self._collage_count_var.get()),
-                "collage_same_for_all": bool(self._collage_same_var.get()),
-                "language": self._lang_var.get(),
-            },
-            "paths": {
-                "wallpapers_folder": self._folder_var.get(),
-                "output_folder": self._cfg["paths"].get("output_folder", "assets/output"),
-                "default_wallpaper": self._default_wp_var.get(),
-            },
-            "display": {
-                "fit_mode": self._fit_var.get(),
-            },
-            "hotkeys": {
-                "next_wallpaper": self._hk_next_var.get(),
-                "prev_wallpaper": self._hk_prev_var.get(),
-                "stop_watch": self._hk_stop_var.get(),
-                "default_wallpaper": self._hk_default_var.get(),
-                "toggle_transparency": self._hk_transp_var.get(),
-            },
-        }
+        # Atualiza o dict de config de longa vida in place — evita realocar
+        # quatro dicts aninhados por clique/tick
+        cfg = self._cfg
+        general = cfg.setdefault("general", {})
+        general["mode"] = "collage"
+        general["selection"] = self._sel_var.get()
+        general["interval"] = interval
+        general["collage_count"] = int(self._collage_count_var.get())
+        general["collage_same_for_all"] = bool(self._collage_same_var.get())
+        general["language"] = self._lang_var.get()
+
+        paths = cfg.setdefault("paths", {})
+        paths["wallpapers_folder"] = self._folder_var.get()
+        paths["output_folder"] = paths.get("output_folder", "assets/output")
+        paths["default_wallpaper"] = self._default_wp_var.get()
+
+        cfg.setdefault("display", {})["fit_mode"] = self._fit_var.get()
+
+        hotkeys = cfg.setdefault("hotkeys", {})
+        hotkeys["next_wallpaper"] = self._hk_next_var.get()
+        hotkeys["prev_wallpaper"] = self._hk_prev_var.get()
+        hotkeys["stop_watch"] = self._hk_stop_var.get()
+        hotkeys["default_wallpaper"] = self._hk_default_var.get()
+        hotkeys["toggle_transparency"] = self._hk_transp_var.get()
+
+        self._cfg_cache = cfg
+        return cfg
 
     # ── Actions ───────────────────────────────────────────────────────────────
+    def _resolve_out_dir(self, cfg: dict) -> Path:
+        """Resolve (e cria) o diretorio de saida, memoizado por valor bruto."""
+        raw = cfg["paths"]["output_folder"]
+        if self._out_dir_cache is None or self._out_dir_cache[0] != raw:
+            p = resolve_path(raw)
+            p.mkdir(parents=True, exist_ok=True)
+            self._out_dir_cache = (raw, p)
+        return self._out_dir_cache[1]
+
     def _apply_now(self) -> None:
         if not self._monitors:
             self._set_status(t("no_monitor_action"), error=True)
             return
-        self._apply_btn.configure(state=DISABLED, text=t("applying"))
-        self._set_status(t("applying"))
-
-        def _work() -> None:
+        try:
+            self._apply_q.put_nowait(self._collect_config())
+        except queue.Full:
+            return  # ja existe uma aplicacao pendente — coalesce
+        with self._batch_ui():
+            self._apply_btn.configure(state=DISABLED, text=t("applying"))
+            self._set_status(t("applying"))
+
+    def _apply_worker(self) -> None:
+        """Worker persistente: consome a fila e aplica um wallpaper por vez."""
+        while True:
+            cfg = self._apply_q.get()
             try:
-                cfg = self._collect_config()
-                out_dir = resolve_path(cfg["paths"]["output_folder"])
-                out_dir.mkdir(parents=True, exist_ok=True)
+                out_dir = self._resolve_out_dir(cfg)
                 out, images_used = apply_wallpaper(cfg, self._monitors, out_dir)
                 # Track history
                 if self._wp_hist_idx < len(self._wp_history) - 1:
                     self._wp_history = self._wp_history[: self._wp_hist_idx + 1]
                 self._wp_history.append(images_used)
                 self._wp_hist_idx = len(self._wp_history) - 1
-                self.after(0, lambda: self._set_status(
-                    t("wallpaper_applied", name=Path(str(out)).name),
+                self.after(0, lambda o=out: self._set_status(
+                    t("wallpaper_applied", name=Path(str(o)).name),
                 ))
             except Exception as exc:
-                self.after(0, lambda: self._set_status(t("error_prefix", msg=exc), error=True))
+                self.after(0, lambda e=exc: self._set_status(
+                    t("error_prefix", msg=e), error=True,
+                ))
             finally:
                 self.after(0, lambda: self._apply_btn.configure(
                     state=NORMAL, text=t("apply_now"),
                 ))
 
-        threading.Thread(target=_work, daemon=True).start()
-
     def _save_config(self) -> None:
         try:
             cfg = self._collect_config()
@@ -984,24 +1127,28 @@ class WallpaperChangerApp(ttk.Window):
     def _toggle_watch(self) -> None:
         if self._watching:
             self._watching = False
-            schedule.clear()
-            self._watch_btn.configure(text=t("start_watch"), style="info.TButton")
-            self._set_status(t("watch_disabled"))
+            if self._watch_job is not None:
+                self.after_cancel(self._watch_job)
+                self._watch_job = None
+            with self._batch_ui():
+                self._watch_btn.configure(text=t("start_watch"), style="info.TButton")
+                self._set_status(t("watch_disabled"))
         else:
             cfg = self._collect_config()
             interval = cfg["general"]["interval"]
             self._watching = True
-            self._watch_btn.configure(text=t("stop_watch"), style="danger.TButton")
-            self._set_status(t("watch_active", n=interval))
-            schedule.every(interval).seconds.do(self._apply_now)
-
-            def _loop() -> None:
-                while self._watching:
-                    schedule.run_pending()
-                    time.sleep(1)
-
-            self._watch_thr = threading.Thread(target=_loop, daemon=True)
-            self._watch_thr.start()
+            with self._batch_ui():
+                self._watch_btn.configure(text=t("stop_watch"), style="danger.TButton")
+                self._set_status(t("watch_active", n=interval))
+            self._watch_job = self.after(interval * 1000, self._watch_tick)
+
+    def _watch_tick(self) -> None:
+        """Timer da rotacao automatica — roda no loop do Tk, sem thread extra."""
+        if not self._watching:
+            return
+        self._apply_now()
+        interval = self._collect_config()["general"]["interval"]
+        self._watch_job = self.after(interval * 1000, self._watch_tick)
 
     # ── Hotkey actions ────────────────────────────────────────────────────────
 
@@ -1020,8 +1167,7 @@ class WallpaperChangerApp(ttk.Window):
         def _work() -> None:
             try:
                 cfg = self._collect_config()
-                out_dir = resolve_path(cfg["paths"]["output_folder"])
-                out_dir.mkdir(parents=True, exist_ok=True)
+                out_dir = self._resolve_out_dir(cfg)
                 out, _ = apply_wallpaper(cfg, self._monitors, out_dir, preset_images=images)
                 self.after(0, lambda: self._set_status(
                     t("prev_applied", name=Path(str(out)).name),
@@ -1044,8 +1190,7 @@ class WallpaperChangerApp(ttk.Window):
         def _work() -> None:
             try:
                 cfg = self._collect_config()
-                out_dir = resolve_path(cfg["paths"]["output_folder"])
-                out_dir.mkdir(parents=True, exist_ok=True)
+                out_dir = self._resolve_out_dir(cfg)
                 fit = cfg["display"]["fit_mode"]
                 out = apply_single_wallpaper(path, self._monitors, out_dir, fit)
                 self.after(0, lambda: self._set_status(
@@ -1104,6 +1249,12 @@ class WallpaperChangerApp(ttk.Window):
         if chosen:
             self._default_wp_var.set(chosen)
 
+    @contextmanager
+    def _batch_ui(self):
+        """Agrupa mutacoes de widgets e despacha um unico update_idletasks."""
+        yield
+        self.update_idletasks()
+
     def _set_status(self, msg: str, error: bool = False) -> None:
         color = "#e74c3c" if error else "gray"
         self._status_lbl.configure(text=msg, foreground=color)
@@ -1144,7 +1295,9 @@ class WallpaperChangerApp(ttk.Window):
             "WallpaperChanger", self._make_tray_image(), "WallpaperChanger", menu,
         )
 
-        threading.Thread(target=self._tray_icon.run, daemon=True).start()
+        # run_detached integrates with the host event loop instead of a
+        # dedicated thread blocking in Icon.run().
+        self._tray_icon.run_detached()
 
     def _show_from_tray(self) -> None:
         self.deiconify()
@@ -1156,7 +1309,9 @@ class WallpaperChangerApp(ttk.Window):
 
     def _quit_app(self) -> None:
         self._watching = False
-        schedule.clear()
+        if self._watch_job is not None:
+            self.after_cancel(self._watch_job)
+            self._watch_job = None
         self._hk_manager.unregister_all()
         # Save transparency before exit
         self._save_transparency_settings()
@@ -31,34 +31,70 @@ def read_hotkey() -> str:
 
 
 class HotkeyManager:
-    """Register / unregister global hotkeys."""
+    """Register / unregister global hotkeys.
+
+    A single low-level ``on_press`` hook dispatches all combos from an
+    in-Python table, instead of installing one *keyboard* hook per hotkey
+    (each of which the library walks on every keystroke).
+    """
 
     def __init__(self) -> None:
-        self._registered: list[str] = []
+        # combo -> (main key, modifier keys, callback)
+        self._combos: dict[str, tuple[str, tuple[str, ...], Callable[[], None]]] = {}
+        self._hook: object | None = None
+
+    def _ensure_hook(self) -> None:
+        if self._hook is None and _AVAILABLE:
+            self._hook = _kb.on_press(self._dispatch)  # type: ignore[union-attr]
+
+    def _dispatch(self, event) -> None:
+        name = (event.name or "").lower()
+        # Snapshot: este hook roda na thread do keyboard enquanto update()
+        # pode mutar o dict na thread do Tk
+        for main, mods, cb in list(self._combos.values()):
+            if name == main and all(_kb.is_pressed(m) for m in mods):  # type: ignore[union-attr]
+                try:
+                    cb()
+                except Exception as exc:
+                    log.warning("Hotkey callback failed: %s", exc)
 
     def register(self, combo: str, callback: Callable[[], None]) -> None:
-        """Register a single global hotkey."""
+        """Register a single global hotkey (duplicates are ignored)."""
         if not _AVAILABLE or not combo.strip():
             return
-        try:
-            _kb.add_hotkey(combo, callback, suppress=False)  # type: ignore[union-attr]
-            self._registered.append(combo)
-        except Exception as exc:
-            log.warning("Cannot register hotkey %r: %s", combo, exc)
+        if combo in self._combos:
+            return
+        parts = [p.strip().lower() for p in combo.split("+") if p.strip()]
+        if not parts:
+            return
+        self._ensure_hook()
+        self._combos[combo] = (parts[-1], tuple(parts[:-1]), callback)
+
+    def _unregister_one(self, combo: str) -> None:
+        self._combos.pop(combo, None)
 
     def unregister_all(self) -> None:
         """Remove every hotkey registered through this manager."""
-        if not _AVAILABLE:
-            return
-        for hk in self._registered:
+        self._combos.clear()
+        if self._hook is not None:
             try:
-                _kb.remove_hotkey(hk)  # type: ignore[union-attr]
+                _kb.unhook(self._hook)  # type: ignore[union-attr]
             except Exception:
                 pass
-        self._registered.clear()
+            self._hook = None
 
     def update(self, bindings: dict[str, Callable[[], None]]) -> None:
-        """Replace all current hotkeys with *bindings*."""
-        self.unregister_all()
+        """Reconcile the registered hotkeys with *bindings* (differential)."""
+        for combo in list(self._combos):
+            if combo not in bindings:
+                self._unregister_one(combo)
         for combo, cb in bindings.items():
+            current = self._combos.get(combo)
+            if current is not None:
+                # A GUI recria as lambdas a cada chamada, entao comparar
+                # identidade de callback nunca daria hit — o diff e por
+                # combo: troca so o callback, sem re-parsear a combinacao
+                if current[2] is not cb:
+                    self._combos[combo] = (current[0], current[1], cb)
+                continue
             self.register(combo, cb)
@@ -0,0 +1,119 @@
+"""Japanese translations (loaded on demand by i18n)."""
+from __future__ import annotations
+
+TRANSLATIONS: dict[str, str] = {
+    # Window
+    "window_title": "WallpaperChanger",
+    "header_subtitle": "コントロールパネル  |  Windows",
+    "detecting": "検出中...",
+
+    # Monitor panel
+    "monitors": "モニター",
+    "detect": "検出",
+    "no_monitor_detected": "モニターが検出されませんでした",
+    "monitors_count": "モニター {n} 台",
+    "monitor_singular": "台",
+    "monitor_plural": "台",
+
+    # Collage
+    "collage_title": "コラージュ — モニターあたりの画像数",
+    "collage_same": "すべてのモニターで同じ画像を使用",
+
+    # Selection
+    "selection_title": "画像の選択",
+    "sel_random": "ランダム",
+    "sel_sequential": "順次",
+
+    # Fit mode
+    "fit_title": "フィットモード",
+    "fit_fill": "塗りつぶし",
+    "fit_fill_desc": "拡大して覆い、余分を切り取る",
+    "fit_fit": "フィット",
+    "fit_fit_desc": "切り取らずに収める、黒帯を追加",
+    "fit_stretch": "引き伸ばし",
+    "fit_stretch_desc": "歪めて正確に埋める",
+    "fit_center": "中央",
+    "fit_center_desc": "リサイズなし、画面中央に配置",
+    "fit_span": "スパン",
+    "fit_span_desc": "画像を全領域に分散配置",
+
+    # Rotation
+    "rotation_title": "自動ローテーション",
+    "interval_label": "間隔：",
+    "seconds": "秒",
+    "start_with_windows": "Windows起動時に開始",
+
+    # Hotkeys
+    "hotkeys_title": "グローバルホットキー",
+    "hk_next": "次の壁紙：",
+    "hk_prev": "前の壁紙：",
+    "hk_stop": "監視の停止/開始：",
+    "hk_default": "デフォルト壁紙：",
+    "hk_transp": "透過度の切り替え：",
+    "hk_record": "記録",
+    "hk_recording": "押してください...",
+    "hk_disabled_warning": "\u26a0 'keyboard'ライブラリ未インストール。ホットキー無効。",
+
+    # Default wallpaper
+    "default_wp_title": "デフォルト壁紙",
+    "default_wp_desc": "「デフォルト壁紙」ホットキーで適用される画像。",
+    "select_default_wp": "デフォルト壁紙を選択",
+
+    # Folder
+    "folder_title": "壁紙フォルダ",
+    "folder_formats": "対応形式: jpg  jpeg  png  bmp  webp",
+    "folder_not_found": "フォルダが見つかりません。",
+    "folder_scanning": "スキャン中...",
+    "folder_images_found": "{n} 枚の画像が見つかりました",
+    "folder_more_images": "... 他 {n} 枚の画像",
+    "images_found_header": "見つかった画像",
+    "select_folder": "壁紙フォルダを選択",
+
+    # Actions
+    "apply_now": "今すぐ適用",
+    "applying": "適用中...",
+    "save_config": "設定を保存",
+    "start_watch": "監視を開始",
+    "stop_watch": "監視を停止",
+    "tray_btn": "トレイ",
+
+    # Status
+    "ready": "準備完了。",
+    "wallpaper_applied": "壁紙を適用しました: {name}",
+    "error_prefix": "エラー: {msg}",
+    "no_monitor_action": "モニターなし。検出をクリックしてください。",
+    "config_saved": "設定を保存しました。",
+    "save_error": "保存エラー: {msg}",
+    "watch_active": "監視中 — {n}秒ごとに変更。",
+    "watch_disabled": "監視を停止しました。",
+    "startup_enabled": "自動起動を有効にしました。",
+    "startup_disabled": "自動起動を無効にしました。",
+    "startup_error": "自動起動の設定エラー: {msg}",
+    "no_prev_wallpaper": "履歴に前の壁紙がありません。",
+    "prev_applied": "前の壁紙を適用しました: {name}",
+    "default_wp_applied": "デフォルト壁紙を適用しました: {name}",
+    "default_wp_not_found": "デフォルト壁紙が未設定またはファイルが見つかりません。",
+    "no_monitor_error": "モニターが検出されませんでした。",
+    "hk_lib_unavailable": "'keyboard'ライブラリが利用できません。",
+
+    # Tray
+    "tray_show": "表示",
+    "tray_apply": "今すぐ適用",
+    "tray_quit": "終了",
+
+    # Single instance
+    "already_running": "アプリケーションは既に実行中です。",
+
+    # Language
+    "language_title": "言語",
+    "language_restart_note": "言語の変更には再起動が必要です。",
+
+    # Transparency
+    "transp_title": "ウィンドウの透過度",
+    "transp_refresh": "更新",
+    "transp_select": "ウィンドウを選択",
+    "transp_shortcut_info": "Alt+A: 50%  ·  Alt+Scroll: 調整",
+    "transp_applied": "透過度 {alpha} を適用",
+    "transp_saved": "透過度設定を保存しました。",
+    "transp_restored": "{n} 件のウィンドウの透過度を復元しました。",
+}
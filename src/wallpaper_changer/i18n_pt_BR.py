@@ -0,0 +1,119 @@
+"""Brazilian Portuguese translations (loaded on demand by i18n)."""
+from __future__ import annotations
+
+TRANSLATIONS: dict[str, str] = {
+    # Window
+    "window_title": "WallpaperChanger",
+    "header_subtitle": "Painel de controle  |  Windows",
+    "detecting": "detectando...",
+
+    # Monitor panel
+    "monitors": "Monitores",
+    "detect": "Detectar",
+    "no_monitor_detected": "Nenhum monitor detectado",
+    "monitors_count": "{n} monitor(es)",
+    "monitor_singular": "monitor",
+    "monitor_plural": "monitores",
+
+    # Collage
+    "collage_title": "Collage — Imagens por Monitor",
+    "collage_same": "Mesmas imagens em todos os monitores",
+
+    # Selection
+    "selection_title": "Seleção de Imagens",
+    "sel_random": "Aleatório",
+    "sel_sequential": "Sequencial",
+
+    # Fit mode
+    "fit_title": "Ajuste na Tela",
+    "fit_fill": "Preencher",
+    "fit_fill_desc": "Expande para cobrir, corta o excesso",
+    "fit_fit": "Ajustar",
+    "fit_fit_desc": "Encaixa sem cortar, adiciona barras pretas",
+    "fit_stretch": "Ampliar",
+    "fit_stretch_desc": "Distorce para preencher exatamente",
+    "fit_center": "Centralizar",
+    "fit_center_desc": "Sem redimensionar, centraliza na tela",
+    "fit_span": "Estender",
+    "fit_span_desc": "Imagem distribuída por todo o espaço",
+
+    # Rotation
+    "rotation_title": "Rotação Automática",
+    "interval_label": "Intervalo:",
+    "seconds": "segundos",
+    "start_with_windows": "Iniciar com o Windows",
+
+    # Hotkeys
+    "hotkeys_title": "Atalhos Globais",
+    "hk_next": "Próximo wallpaper:",
+    "hk_prev": "Wallpaper anterior:",
+    "hk_stop": "Parar/Iniciar Watch:",
+    "hk_default": "Wallpaper padrão:",
+    "hk_transp": "Alternar transparência:",
+    "hk_record": "Gravar",
+    "hk_recording": "Pressione...",
+    "hk_disabled_warning": "\u26a0 Biblioteca 'keyboard' não instalada. Atalhos desativados.",
+
+    # Default wallpaper
+    "default_wp_title": "Wallpaper Padrão",
+    "default_wp_desc": "Imagem aplicada pelo atalho 'Wallpaper padrão'.",
+    "select_default_wp": "Selecione o wallpaper padrão",
+
+    # Folder
+    "folder_title": "Pasta de Wallpapers",
+    "folder_formats": "Formatos suportados: jpg  jpeg  png  bmp  webp",
+    "folder_not_found": "Pasta não encontrada.",
+    "folder_scanning": "Escaneando...",
+    "folder_images_found": "{n} imagem(ns) encontrada(s)",
+    "folder_more_images": "... e mais {n} imagens",
+    "images_found_header": "Imagens encontradas",
+    "select_folder": "Selecione a pasta de wallpapers",
+
+    # Actions
+    "apply_now": "Aplicar Agora",
+    "applying": "Aplicando...",
+    "save_config": "Salvar Config",
+    "start_watch": "Iniciar Watch",
+    "stop_watch": "Parar Watch",
+    "tray_btn": "Bandeja",
+
+    # Status
+    "ready": "Pronto.",
+    "wallpaper_applied": "Wallpaper aplicado: {name}",
+    "error_prefix": "Erro: {msg}",
+    "no_monitor_action": "Nenhum monitor. Clique em Detectar.",
+    "config_saved": "Configurações salvas.",
+    "save_error": "Erro ao salvar: {msg}",
+    "watch_active": "Watch ativo — trocando a cada {n}s.",
+    "watch_disabled": "Watch desativado.",
+    "startup_enabled": "Início automático ativado.",
+    "startup_disabled": "Início automático desativado.",
+    "startup_error": "Erro ao configurar início automático: {msg}",
+    "no_prev_wallpaper": "Nenhum wallpaper anterior no histórico.",
+    "prev_applied": "Wallpaper anterior aplicado: {name}",
+    "default_wp_applied": "Wallpaper padrão aplicado: {name}",
+    "default_wp_not_found": "Wallpaper padrão não configurado ou arquivo não encontrado.",
+    "no_monitor_error": "Nenhum monitor detectado.",
+    "hk_lib_unavailable": "Biblioteca 'keyboard' não disponível.",
+
+    # Tray
+    "tray_show": "Mostrar",
+    "tray_apply": "Aplicar Agora",
+    "tray_quit": "Sair",
+
+    # Single instance
+    "already_running": "O aplicativo já está em execução.",
+
+    # Language
+    "language_title": "Idioma",
+    "language_restart_note": "Mudança de idioma requer reinicialização.",
+
+    # Transparency
+    "transp_title": "Transparência de Janela",
+    "transp_refresh": "Atualizar",
+    "transp_select": "Selecione uma janela",
+    "transp_shortcut_info": "Alt+A: 50%  ·  Alt+Scroll: ajustar",
+    "transp_applied": "Opacidade {alpha} aplicada",
+    "transp_saved": "Configurações de transparência salvas.",
+    "transp_restored": "Restaurada opacidade de {n} janela(s).",
+}
@@ -1,26 +1,96 @@
 """Utilitarios de composicao, selecao e redimensionamento de imagens."""
 from __future__ import annotations
+import heapq
 import json
+import os
 import random
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from PIL import Image
+from PIL import Image, ImageOps
+
+# orjson (C/SIMD) acelera o estado lido+gravado a cada rotacao; opcional,
+# com fallback para o json da stdlib
+try:
+    import orjson as _orjson
+
+    def _dumps(obj: dict) -> bytes:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+
+    _loads = _orjson.loads
+except ImportError:
+    def _dumps(obj: dict) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    _loads = json.loads
 
 SUPPORTED = {".jpg", ".jpeg", ".png", ".bmp", ".webp"}
 
+# Mesmas extensoes sem o ponto, para comparar contra fatias de entry.name
+_SUFFIXES = frozenset(s[1:] for s in SUPPORTED)
+
 # ── Listagem ──────────────────────────────────────────────────────────────────
 
+# Caches de listagem por pasta, invalidados pelo mtime do diretorio (que muda
+# quando arquivos sao adicionados/removidos). Uma entrada por pasta; as listas
+# retornadas sao compartilhadas — os chamadores nao devem muta-las.
+_listing_cache: dict[str, tuple[int, list[Path]]] = {}
+_sorted_cache: dict[str, tuple[int, list[Path]]] = {}
+
+
+@lru_cache(maxsize=64)
+def _resolve_key(folder: str) -> str:
+    """Chave canonica de uma pasta (resolve() faz syscalls no Windows)."""
+    return str(Path(folder).resolve())
+
+
 def list_images(folder: str | Path) -> list[Path]:
     """Retorna todas as imagens suportadas na pasta (sem sub-pastas)."""
     folder = Path(folder)
-    if not folder.exists():
+    key = _resolve_key(str(folder))
+    try:
+        mtime = folder.stat().st_mtime_ns
+        cached = _listing_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        # os.scandir evita criar um Path (e normalizar o sufixo) por entrada:
+        # so os nomes que casam com uma extensao suportada viram Path.
+        with os.scandir(folder) as it:
+            images = [
+                Path(e.path)
+                for e in it
+                if e.is_file() and e.name.rpartition(".")[2].lower() in _SUFFIXES
+            ]
+    except OSError:
         return []
-    return [p for p in folder.iterdir() if p.suffix.lower() in SUPPORTED]
+    _listing_cache[key] = (mtime, images)
+    return images
+
 
+def list_images_sorted_by_date(
+    folder: str | Path, limit: int | None = None,
+) -> list[Path] | tuple[list[Path], int]:
+    """Retorna imagens ordenadas da mais recente para a mais antiga (mtime).
 
-def list_images_sorted_by_date(folder: str | Path) -> list[Path]:
-    """Retorna imagens ordenadas da mais recente para a mais antiga (mtime)."""
+    Com `limit`, retorna `(imagens[:limit], total)` — util para a GUI, que so
+    exibe as N primeiras mas precisa do total. Evita ordenar/materializar a
+    lista inteira para pastas grandes.
+    """
     images = list_images(folder)
-    return sorted(images, key=lambda p: p.stat().st_mtime, reverse=True)
+    if limit is not None:
+        top = heapq.nlargest(limit, images, key=lambda p: p.stat().st_mtime)
+        return top, len(images)
+    if not images:
+        return []
+    folder = Path(folder)
+    key = _resolve_key(str(folder))
+    mtime = folder.stat().st_mtime_ns
+    cached = _sorted_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    ordered = sorted(images, key=lambda p: p.stat().st_mtime, reverse=True)
+    _sorted_cache[key] = (mtime, ordered)
+    return ordered
 
 
 # ── Selecao ───────────────────────────────────────────────────────────────────
@@ -28,15 +98,28 @@ def list_images_sorted_by_date(folder: str | Path) -> list[Path]:
 def _load_state(state_file: Path) -> dict:
     if state_file.exists():
         try:
-            return json.loads(state_file.read_text(encoding="utf-8"))
+            return _loads(state_file.read_bytes())
         except Exception:
             pass
     return {}
 
 
+# Ultimo JSON gravado por arquivo — evita regravar estado identico
+_last_saved: dict[str, bytes] = {}
+
+
 def _save_state(state_file: Path, state: dict) -> None:
+    payload = _dumps(state)
+    key = str(state_file)
+    if _last_saved.get(key) == payload:
+        return
     state_file.parent.mkdir(parents=True, exist_ok=True)
-    state_file.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    # Escrita atomica: tmp + os.replace evita state.json truncado se o
+    # processo morrer no meio da gravacao.
+    tmp = state_file.with_suffix(state_file.suffix + ".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, state_file)
+    _last_saved[key] = payload
 
 
 def pick_images(
@@ -59,7 +142,7 @@ def pick_images(
             raise FileNotFoundError(f"Nenhuma imagem em: {folder}")
         sf = state_file or (Path(folder).parent.parent / "config" / "state.json")
         state = _load_state(sf)
-        folder_key = str(Path(folder).resolve())
+        folder_key = _resolve_key(str(folder))
         idx = state.get(folder_key, 0)
         # seleciona `count` imagens a partir de idx, com wrap-around
         result: list[Path] = []
@@ -75,20 +158,21 @@ def pick_images(
 
         sf = state_file or (Path(folder).parent.parent / "config" / "state.json")
         state = _load_state(sf)
-        folder_key = str(Path(folder).resolve())
+        folder_key = _resolve_key(str(folder))
         history_key = folder_key + ":random_history"
 
         # Historico de nomes de arquivo ja exibidos neste ciclo
         shown: list[str] = state.get(history_key, [])
         shown_set = set(shown)
 
-        # Imagens ainda nao exibidas neste ciclo
-        available = [p for p in images if p.name not in shown_set]
+        # Imagens ainda nao exibidas neste ciclo — diferenca de conjuntos
+        # sobre os basenames em vez de varrer images x shown
+        image_names = {p.name: p for p in images}
+        available = [image_names[n] for n in image_names.keys() - shown_set]
 
         # Se nao ha suficientes, reinicia o ciclo
         if len(available) < count:
             shown = []
-            shown_set = set()
             available = list(images)
 
         if count >= len(available):
@@ -99,9 +183,10 @@ def pick_images(
         else:
             picked = random.sample(available, count)
 
-        # Atualiza historico
+        # Atualiza historico (limitado ao tamanho da pasta — nomes de arquivos
+        # removidos nao se acumulam entre ciclos)
         shown.extend(p.name for p in picked)
-        state[history_key] = shown
+        state[history_key] = shown[-len(images):]
         _save_state(sf, state)
         return picked
 
@@ -114,6 +199,26 @@ def pick_random(folder: str | Path) -> Path:
 
 # ── Redimensionamento ─────────────────────────────────────────────────────────
 
+# Canvases pretos reutilizaveis por (w, h) — evita alocar (e descartar) um
+# buffer de varios MB por tile/aplicacao. Os chamadores NAO devem reter a
+# imagem retornada apos o uso: a proxima chamada com o mesmo tamanho reusa
+# e limpa o mesmo buffer (copie com .copy() se precisar guardar).
+_canvas_cache: OrderedDict[tuple[int, int], Image.Image] = OrderedDict()
+_CANVAS_CACHE_MAX = 4
+
+
+def _get_canvas(w: int, h: int) -> Image.Image:
+    key = (w, h)
+    canvas = _canvas_cache.pop(key, None)
+    if canvas is None:
+        canvas = Image.new("RGB", key, (0, 0, 0))
+    else:
+        canvas.paste((0, 0, 0), (0, 0, w, h))
+    _canvas_cache[key] = canvas
+    while len(_canvas_cache) > _CANVAS_CACHE_MAX:
+        _canvas_cache.popitem(last=False)
+    return canvas
+
 def fit_image(img: Image.Image, target_w: int, target_h: int, mode: str = "fill") -> Image.Image:
     """
     Modos suportados:
@@ -128,34 +233,29 @@ def fit_image(img: Image.Image, target_w: int, target_h: int, mode: str = "fill"
 
     src_w, src_h = img.size
 
+    # Fast path: imagem ja no tamanho do alvo — nada a redimensionar/cortar
+    if (src_w, src_h) == (target_w, target_h):
+        return img if img.mode == "RGB" else img.convert("RGB")
+
     if mode == "stretch":
-        return img.resize((target_w, target_h), Image.LANCZOS)
+        return img.resize((target_w, target_h), Image.LANCZOS, reducing_gap=3.0)
 
     if mode == "center":
-        canvas = Image.new("RGB", (target_w, target_h), (0, 0, 0))
+        canvas = _get_canvas(target_w, target_h)
         offset_x = (target_w - src_w) // 2
         offset_y = (target_h - src_h) // 2
         canvas.paste(img, (offset_x, offset_y))
         return canvas
 
-    ratio_w = target_w / src_w
-    ratio_h = target_h / src_h
-    ratio   = max(ratio_w, ratio_h) if mode == "fill" else min(ratio_w, ratio_h)
-    new_w   = int(src_w * ratio)
-    new_h   = int(src_h * ratio)
-    img     = img.resize((new_w, new_h), Image.LANCZOS)
-
+    # Primitivas fundidas do ImageOps: uma unica passada sobre o buffer em vez
+    # de resize + crop/paste separados (e se pillow-simd estiver instalado,
+    # os kernels LANCZOS vetorizados aceleram sem mudanca de codigo).
     if mode == "fill":
-        left = (new_w - target_w) // 2
-        top  = (new_h - target_h) // 2
-        return img.crop((left, top, left + target_w, top + target_h))
-    else:  # fit – centraliza com fundo preto
-        canvas = Image.new("RGB", (target_w, target_h), (0, 0, 0))
-        offset_x = (target_w - new_w) // 2
-        offset_y = (target_h - new_h) // 2
-        canvas.paste(img, (offset_x, offset_y))
-        return canvas
+        return ImageOps.fit(img, (target_w, target_h), Image.LANCZOS)
+    # fit – centraliza com fundo preto
+    return ImageOps.pad(img, (target_w, target_h), Image.LANCZOS, color=(0, 0, 0))
 
 
 def build_canvas(total_w: int, total_h: int) -> Image.Image:
-    return Image.new("RGB", (total_w, total_h), (0, 0, 0))
+    """Canvas preto do desktop virtual (buffer reutilizado — nao reter)."""
+    return _get_canvas(total_w, total_h)
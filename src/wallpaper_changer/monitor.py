@@ -2,7 +2,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Monitor:
     index: int
     x: int
@@ -15,8 +15,13 @@ def get_monitors() -> list[Monitor]:
     return [Monitor(i, m.x, m.y, m.width, m.height) for i, m in enumerate(_get())]
 
 def get_virtual_desktop_size(monitors: list[Monitor]) -> tuple[int, int]:
-    right  = max(m.x + m.width  for m in monitors)
-    bottom = max(m.y + m.height for m in monitors)
-    left   = min(m.x for m in monitors)
-    top    = min(m.y for m in monitors)
+    # Uma unica passada pela lista em vez de quatro min/max separados
+    first = monitors[0]
+    left, top = first.x, first.y
+    right, bottom = first.x + first.width, first.y + first.height
+    for m in monitors[1:]:
+        left = min(left, m.x)
+        top = min(top, m.y)
+        right = max(right, m.x + m.width)
+        bottom = max(bottom, m.y + m.height)
     return (right - left, bottom - top)
@@ -2,14 +2,22 @@
 from __future__ import annotations
 
 import sys
+import time
 import winreg
+from functools import cache
 from pathlib import Path
 
 _APP_NAME = "WallpaperChanger"
 _RUN_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
 _STARTUP_FLAG = "--startup"
 
+# Resultado de is_startup_enabled com TTL curto — o registro so muda via
+# set_startup_enabled (que invalida) ou edicao externa rara.
+_ENABLED_TTL = 5.0
+_enabled_cache: tuple[float, bool] | None = None
 
+
+@cache
 def _get_exe_path() -> str:
     """Retorna o caminho do executavel atual (com flag --startup)."""
     if getattr(sys, "frozen", False):
@@ -26,19 +34,26 @@ def is_startup_launch() -> bool:
 
 def is_startup_enabled() -> bool:
     """Verifica se o app esta configurado para iniciar com o Windows."""
+    global _enabled_cache  # noqa: PLW0603 (cache de modulo)
+    now = time.monotonic()
+    if _enabled_cache is not None and now - _enabled_cache[0] < _ENABLED_TTL:
+        return _enabled_cache[1]
     try:
         key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, _RUN_KEY, 0, winreg.KEY_READ)
         val, _ = winreg.QueryValueEx(key, _APP_NAME)
         winreg.CloseKey(key)
-        return bool(val)
+        enabled = bool(val)
     except FileNotFoundError:
-        return False
+        enabled = False
     except OSError:
-        return False
+        enabled = False
+    _enabled_cache = (now, enabled)
+    return enabled
 
 
 def set_startup_enabled(enabled: bool) -> None:
     """Ativa ou desativa a inicializacao automatica com o Windows."""
+    global _enabled_cache  # noqa: PLW0603 (cache de modulo)
     key = winreg.OpenKey(
         winreg.HKEY_CURRENT_USER, _RUN_KEY, 0, winreg.KEY_SET_VALUE
     )
@@ -51,3 +66,4 @@ def set_startup_enabled(enabled: bool) -> None:
         except FileNotFoundError:
             pass
     winreg.CloseKey(key)
+    _enabled_cache = (time.monotonic(), enabled)
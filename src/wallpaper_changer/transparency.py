@@ -5,6 +5,9 @@ import ctypes
 import ctypes.wintypes as wt
 import json
 import logging
+import pickle
+import sys
+import time
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -66,6 +69,16 @@ except Exception:
     _HAS_DWM = False
 
 
+# Titles of system/noise windows excluded from enumeration; interned for the
+# per-HWND membership check in list_visible_windows.
+_NOISE_TITLES = frozenset(map(sys.intern, (
+    "Program Manager",
+    "Windows Input Experience",
+    "Settings",
+    "MSCTFIME UI",
+)))
+
+
 # ── Public API ───────────────────────────────────────────────────────────────
 
 def get_foreground_window() -> int:
@@ -73,6 +86,11 @@ def get_foreground_window() -> int:
     return GetForegroundWindow()
 
 
+# HWNDs que ja receberam WS_EX_LAYERED por esta funcao — evita o par
+# GetWindowLongW/SetWindowLongW em ajustes repetidos (ex.: Alt+Scroll)
+_layered_hwnds: set[int] = set()
+
+
 def set_window_opacity(hwnd: int, alpha: int = 255) -> None:
     """Apply *alpha* (0–255) opacity to the window identified by *hwnd*.
 
@@ -85,26 +103,52 @@ def set_window_opacity(hwnd: int, alpha: int = 255) -> None:
     alpha = max(0, min(255, alpha))
 
     if alpha < 255:
-        ex_style = GetWindowLongW(hwnd, GWL_EXSTYLE)
-        if not (ex_style & WS_EX_LAYERED):
-            SetWindowLongW(hwnd, GWL_EXSTYLE, ex_style | WS_EX_LAYERED)
-        SetLayeredWindowAttributes(hwnd, 0, alpha, LWA_ALPHA)
+        if hwnd not in _layered_hwnds:
+            ex_style = GetWindowLongW(hwnd, GWL_EXSTYLE)
+            if not (ex_style & WS_EX_LAYERED):
+                SetWindowLongW(hwnd, GWL_EXSTYLE, ex_style | WS_EX_LAYERED)
+            _layered_hwnds.add(hwnd)
+        if not SetLayeredWindowAttributes(hwnd, 0, alpha, LWA_ALPHA):
+            # HWNDs sao reciclados: o handle no cache pode agora ser outra
+            # janela (sem WS_EX_LAYERED) ou uma janela morta. Refaz o setup
+            # do estilo uma vez e tenta de novo antes de desistir.
+            _layered_hwnds.discard(hwnd)
+            ex_style = GetWindowLongW(hwnd, GWL_EXSTYLE)
+            if not (ex_style & WS_EX_LAYERED):
+                SetWindowLongW(hwnd, GWL_EXSTYLE, ex_style | WS_EX_LAYERED)
+            if SetLayeredWindowAttributes(hwnd, 0, alpha, LWA_ALPHA):
+                _layered_hwnds.add(hwnd)
     else:
         # Remove layered flag to restore full opacity
         ex_style = GetWindowLongW(hwnd, GWL_EXSTYLE)
         if ex_style & WS_EX_LAYERED:
             SetWindowLongW(hwnd, GWL_EXSTYLE, ex_style & ~WS_EX_LAYERED)
+        _layered_hwnds.discard(hwnd)
+
+
+# Estado "cloaked" por HWND com TTL curto — o DwmGetWindowAttribute e uma RPC
+# e o loop de reaplicacao enumera as janelas a cada 2 s.
+_cloak_cache: dict[int, tuple[float, bool]] = {}
+_CLOAK_TTL = 2.0
 
 
 def _is_cloaked(hwnd: int) -> bool:
     """Return True if the window is *cloaked* (invisible UWP/system window)."""
     if not _HAS_DWM:
         return False
+    now = time.monotonic()
+    entry = _cloak_cache.get(hwnd)
+    if entry is not None and now - entry[0] < _CLOAK_TTL:
+        return entry[1]
     cloaked = ctypes.c_int(0)
     hr = DwmGetWindowAttribute(
         hwnd, DWMWA_CLOAKED, ctypes.byref(cloaked), ctypes.sizeof(cloaked),
     )
-    return hr == 0 and cloaked.value != 0
+    result = hr == 0 and cloaked.value != 0
+    if len(_cloak_cache) > 1024:
+        _cloak_cache.clear()
+    _cloak_cache[hwnd] = (now, result)
+    return result
 
 
 def _get_window_title(hwnd: int) -> str:
@@ -150,31 +194,38 @@ def list_visible_windows() -> List[Tuple[int, str, str]]:
     """Enumerate all visible, titled windows, filtering out system noise.
 
     Returns a sorted list of ``(hwnd, title, process_name)`` tuples.
+
+    The EnumWindows callback only collects HWNDs — each callback is a ctypes
+    trampoline crossing, so all filtering happens in a Python post-pass that
+    reuses a single title buffer (cheapest checks first, DWM cloak check last).
     """
-    results: list[tuple[int, str, str]] = []
+    hwnds: list[int] = []
 
     def _callback(hwnd: int, _lp: int) -> bool:
+        hwnds.append(hwnd)
+        return True
+
+    EnumWindows(WNDENUMPROC(_callback), 0)
+
+    results: list[tuple[int, str, str]] = []
+    buf = ctypes.create_unicode_buffer(512)
+    for hwnd in hwnds:
         if not IsWindowVisible(hwnd):
-            return True
+            continue
+        if not GetWindowTextW(hwnd, buf, 512):
+            continue
+        title = buf.value
+        if title in _NOISE_TITLES:
+            continue
         if _is_cloaked(hwnd):
-            return True
-        title = _get_window_title(hwnd)
-        if not title or title in {
-            "Program Manager",
-            "Windows Input Experience",
-            "Settings",
-            "MSCTFIME UI",
-        }:
-            return True
-        
+            continue
+
         proc_name = _get_process_name_for_hwnd(hwnd)
         # Fall back to title if we couldn't get the process name to avoid breaking things
         proc_name = proc_name if proc_name else title
-        
+
         results.append((hwnd, title, proc_name))
-        return True
 
-    EnumWindows(WNDENUMPROC(_callback), 0)
     results.sort(key=lambda t: t[1].lower())
     return results
 
@@ -187,21 +238,48 @@ def _settings_file() -> Path:
     return PROJECT_ROOT / "config" / "transparency.json"
 
 
+# Cache do JSON de transparencia, validado pelo mtime do arquivo — o loop de
+# reaplicacao le as configuracoes a cada 2 s e o arquivo raramente muda.
+_settings_cache: Tuple[int, Dict[str, int]] | None = None
+
+
 def load_opacity_settings() -> Dict[str, int]:
     """Load saved ``{window_title: alpha}`` map from disk."""
+    global _settings_cache  # noqa: PLW0603 (cache de modulo)
     path = _settings_file()
-    if not path.exists():
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
         return {}
+    if _settings_cache is not None and _settings_cache[0] == mtime:
+        return _settings_cache[1]
+    # Espelho binario gravado junto com o JSON: pickle.loads pula o
+    # tokenizador JSON e a revalidacao chave-a-chave. So e usado quando e
+    # pelo menos tao novo quanto o JSON (editado a mao => JSON vence).
+    pkl = path.with_suffix(".pkl")
+    try:
+        if pkl.stat().st_mtime_ns >= mtime:
+            settings = pickle.loads(pkl.read_bytes())
+            if isinstance(settings, dict):
+                _settings_cache = (mtime, settings)
+                return settings
+    except OSError:
+        pass
+    except Exception as exc:
+        log.debug("Ignoring stale transparency pickle: %s", exc)
     try:
         data = json.loads(path.read_text(encoding="utf-8"))
-        return {str(k): int(v) for k, v in data.items()}
+        settings = {str(k): int(v) for k, v in data.items()}
     except Exception as exc:
         log.warning("Cannot read transparency settings: %s", exc)
         return {}
+    _settings_cache = (mtime, settings)
+    return settings
 
 
 def save_opacity_settings(settings: Dict[str, int]) -> None:
     """Persist ``{window_title: alpha}`` map to disk."""
+    global _settings_cache  # noqa: PLW0603 (cache de modulo)
     path = _settings_file()
     path.parent.mkdir(parents=True, exist_ok=True)
     try:
@@ -209,6 +287,10 @@ def save_opacity_settings(settings: Dict[str, int]) -> None:
             json.dumps(settings, indent=2, ensure_ascii=False),
             encoding="utf-8",
         )
+        path.with_suffix(".pkl").write_bytes(
+            pickle.dumps(settings, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        _settings_cache = (path.stat().st_mtime_ns, dict(settings))
     except Exception as exc:
         log.warning("Cannot write transparency settings: %s", exc)
 
@@ -52,6 +52,17 @@ class TransparencyApp(ttk.Window):
         self._listener_thread: threading.Thread | None = None
         self._shortcut_thread: threading.Thread | None = None
 
+        # Slider debounce: only the last value within ~50 ms is applied/saved
+        self._pending_alpha: int | None = None
+        self._slider_after_id: str | None = None
+
+        # Alt+Scroll throttle: ticks accumulate and are applied in one batch
+        self._scroll_accum = 0
+        self._scroll_flush_pending = False
+
+        # Last combobox contents — unchanged refreshes skip the Tk update
+        self._titles_cache: list[str] = []
+
         self._build_ui()
         self._refresh_window_list()
         self._start_global_shortcuts()
@@ -178,10 +189,14 @@ class TransparencyApp(ttk.Window):
         self._windows = list_visible_windows()
         # Show both title and process name in combobox
         display_titles = [f"[{proc}] {title}" for _, title, proc in self._windows]
-        self._combo["values"] = display_titles
-        if display_titles:
-            self._combo.current(0)
-            self._on_window_selected()
+        # Pushing values into the Combobox re-measures/re-lays-out the widget;
+        # skip it (and keep the current selection) when nothing changed.
+        if display_titles != self._titles_cache:
+            self._titles_cache = display_titles
+            self._combo["values"] = display_titles
+            if display_titles:
+                self._combo.current(0)
+                self._on_window_selected()
         self._set_status(f"{len(display_titles)} windows found")
 
     def _selected_hwnd(self) -> int | None:
@@ -216,14 +231,26 @@ class TransparencyApp(ttk.Window):
 
     def _on_slider_change(self, value: str) -> None:
         alpha = int(float(value))
+        # Label updates per tick (cheap); applying + persisting is debounced so
+        # a drag does one SetLayeredWindowAttributes/JSON write, not dozens.
         self._opacity_label.configure(text=str(alpha))
+        self._pending_alpha = alpha
+        if self._slider_after_id is None:
+            self._slider_after_id = self.after(50, self._flush_slider)
+
+    def _flush_slider(self) -> None:
+        self._slider_after_id = None
+        alpha = self._pending_alpha
+        self._pending_alpha = None
+        if alpha is None:
+            return
         hwnd = self._selected_hwnd()
         proc_name = self._selected_process_name()
         if hwnd is None or not proc_name:
             return
-            
+
         _record_opacity(hwnd, alpha)
-        
+
         # Save opacity setting globally for the process
         from .transparency import save_opacity_settings, load_opacity_settings
         settings = load_opacity_settings()
@@ -287,17 +314,13 @@ class TransparencyApp(ttk.Window):
             def on_scroll(_x, _y, _dx, dy):
                 if not self._alt_pressed:
                     return
-                hwnd = get_foreground_window()
-                if not hwnd:
-                    return
-                current = _get_opacity(hwnd)
-                new_alpha = current + (int(dy) * _OPACITY_STEP)
-                new_alpha = max(10, min(255, new_alpha))
-                _record_opacity(hwnd, new_alpha)
-                self.after(0, self._sync_slider_if_match, hwnd)
-                self.after(0, lambda a=new_alpha: self._set_status(
-                    f"Scroll opacity → {a}",
-                ))
+                # A fast wheel emits dozens of ticks; accumulate and apply
+                # them in one batch ~30 ms later instead of one Win32
+                # round-trip per tick.
+                self._scroll_accum += int(dy)
+                if not self._scroll_flush_pending:
+                    self._scroll_flush_pending = True
+                    self.after(30, self._flush_scroll)
 
             # Start listeners (blocking, but in daemon thread)
             self._kb_listener = pynput_kb.Listener(
@@ -315,6 +338,19 @@ class TransparencyApp(ttk.Window):
         except Exception:
             pass
 
+    def _flush_scroll(self) -> None:
+        self._scroll_flush_pending = False
+        delta, self._scroll_accum = self._scroll_accum, 0
+        if not delta:
+            return
+        hwnd = get_foreground_window()
+        if not hwnd:
+            return
+        new_alpha = max(10, min(255, _get_opacity(hwnd) + delta * _OPACITY_STEP))
+        _record_opacity(hwnd, new_alpha)
+        self._sync_slider_if_match(hwnd)
+        self._set_status(f"Scroll opacity → {new_alpha}")
+
     def _sync_slider_if_match(self, hwnd: int) -> None:
         """If the given hwnd matches the combo selection, update the slider."""
         selected = self._selected_hwnd()
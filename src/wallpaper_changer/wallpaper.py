@@ -1,13 +1,31 @@
 """Montagem do wallpaper composto e aplicacao no Windows 11."""
 from __future__ import annotations
 
+import atexit
 import ctypes
+import hashlib
 import math
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
 import winreg
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from PIL import Image
 
+# numpy acelera o fade (lerp vetorizado com buffer reutilizado); opcional,
+# com fallback para Image.blend
+try:
+    import numpy as _np
+except ImportError:
+    _np = None  # type: ignore[assignment]
+
 from .config import resolve_path, get_project_root
 from .image_utils import fit_image, pick_images, build_canvas
 from .monitor import Monitor, get_monitors
@@ -16,6 +34,10 @@ SPI_SETDESKWALLPAPER  = 0x0014
 SPIF_UPDATEINIFILE    = 0x0001
 SPIF_SENDWININICHANGE = 0x0002
 
+HWND_BROADCAST   = 0xFFFF
+WM_SETTINGCHANGE = 0x001A
+SMTO_ABORTIFHUNG = 0x0002
+
 MODES = ["collage"]
 
 
@@ -23,24 +45,76 @@ MODES = ["collage"]
 
 def get_virtual_desktop(monitors: list[Monitor]) -> tuple[int, int, int, int]:
     """Retorna (min_x, min_y, total_width, total_height) do desktop virtual."""
-    min_x = min(m.x for m in monitors)
-    min_y = min(m.y for m in monitors)
-    max_x = max(m.x + m.width for m in monitors)
-    max_y = max(m.y + m.height for m in monitors)
+    # Monitor e um dataclass frozen (hashavel) — memoiza por configuracao de
+    # monitores; a funcao roda varias vezes por aplicacao de wallpaper
+    return _virtual_desktop(tuple(monitors))
+
+
+@lru_cache(maxsize=4)
+def _virtual_desktop(monitors: tuple[Monitor, ...]) -> tuple[int, int, int, int]:
+    # Uma unica passada pela tupla em vez de quatro min/max separados
+    first = monitors[0]
+    min_x, min_y = first.x, first.y
+    max_x, max_y = first.x + first.width, first.y + first.height
+    for m in monitors[1:]:
+        min_x = min(min_x, m.x)
+        min_y = min(min_y, m.y)
+        max_x = max(max_x, m.x + m.width)
+        max_y = max(max_y, m.y + m.height)
     return min_x, min_y, max_x - min_x, max_y - min_y
 
 
+# Handle da chave Control Panel\Desktop, aberto uma vez por processo —
+# set_wallpaper_style_span roda a cada aplicacao (e por frame de fade).
+_desktop_key = None
+
+
+def _get_desktop_key():
+    global _desktop_key  # noqa: PLW0603 (cache de modulo)
+    if _desktop_key is None:
+        _desktop_key = winreg.OpenKey(
+            winreg.HKEY_CURRENT_USER,
+            r"Control Panel\Desktop",
+            0,
+            winreg.KEY_SET_VALUE | winreg.KEY_QUERY_VALUE,
+        )
+        atexit.register(_close_desktop_key)
+    return _desktop_key
+
+
+def _close_desktop_key() -> None:
+    global _desktop_key  # noqa: PLW0603 (cache de modulo)
+    if _desktop_key is not None:
+        try:
+            winreg.CloseKey(_desktop_key)
+        except OSError:
+            pass
+        _desktop_key = None
+
+
+# Uma vez confirmado que o registro ja esta em modo span, nem as leituras
+# sao repetidas — nada mais neste processo altera esses valores.
+_style_confirmed = False
+
+
 def set_wallpaper_style_span() -> None:
     """Configura o Windows para exibir o wallpaper em modo span (estendido)."""
-    key = winreg.OpenKey(
-        winreg.HKEY_CURRENT_USER,
-        r"Control Panel\Desktop",
-        0,
-        winreg.KEY_SET_VALUE,
-    )
-    winreg.SetValueEx(key, "WallpaperStyle", 0, winreg.REG_SZ, "22")
-    winreg.SetValueEx(key, "TileWallpaper", 0, winreg.REG_SZ, "0")
-    winreg.CloseKey(key)
+    global _style_confirmed  # noqa: PLW0603 (cache de modulo)
+    if _style_confirmed:
+        return
+    key = _get_desktop_key()
+    try:
+        style = winreg.QueryValueEx(key, "WallpaperStyle")[0]
+        tile = winreg.QueryValueEx(key, "TileWallpaper")[0]
+    except OSError:
+        style = tile = None
+    # So grava quando os valores divergem — escrita no registro dispara
+    # notificacoes de mudanca; leitura e barata
+    if style != "22":
+        winreg.SetValueEx(key, "WallpaperStyle", 0, winreg.REG_SZ, "22")
+    if tile != "0":
+        winreg.SetValueEx(key, "TileWallpaper", 0, winreg.REG_SZ, "0")
+    _style_confirmed = True
 
 
 def set_wallpaper_win(path: str | Path) -> None:
@@ -57,20 +131,52 @@ def set_wallpaper_win(path: str | Path) -> None:
         raise RuntimeError("SystemParametersInfoW falhou ao aplicar o wallpaper")
 
 
-def _set_wallpaper_fast(path: str | Path) -> None:
+def _set_wallpaper_fast(abs_path: str) -> None:
     """
     Aplica wallpaper SEM broadcast de WM_SETTINGCHANGE.
 
     Muito mais rapido que set_wallpaper_win() porque nao espera que todas
     as janelas do sistema confirmem a mudanca. Ideal para frames
     intermediarios de fade onde velocidade e critica.
+
+    Recebe o caminho JA absoluto: o chamador resolve uma unica vez em vez
+    de pagar o par GetFullPathNameW/GetLongPathNameW por frame.
+    """
+    ctypes.windll.user32.SystemParametersInfoW(
+        SPI_SETDESKWALLPAPER,
+        0,
+        abs_path,
+        0,  # sem broadcast e sem persistir: frames transitorios nao devem
+            # gravar no registro — so o frame final (set_wallpaper_win) persiste
+    )
+
+
+def _set_wallpaper_broadcast_async(path: str | Path) -> None:
+    """
+    Aplica e persiste o wallpaper com broadcast de prazo limitado.
+
+    SPIF_SENDWININICHANGE espera TODAS as janelas do sistema confirmarem o
+    WM_SETTINGCHANGE — uma janela travada segura o fim da animacao. Aqui o
+    wallpaper e persistido (SPIF_UPDATEINIFILE) e o broadcast sai via
+    SendMessageTimeoutW com timeout de 50 ms por janela (SMTO_ABORTIFHUNG).
     """
     abs_path = str(Path(path).resolve())
+    set_wallpaper_style_span()
     ctypes.windll.user32.SystemParametersInfoW(
         SPI_SETDESKWALLPAPER,
         0,
         abs_path,
-        SPIF_UPDATEINIFILE,  # apenas grava no registro, sem broadcast
+        SPIF_UPDATEINIFILE,
+    )
+    result = ctypes.c_ulong()
+    ctypes.windll.user32.SendMessageTimeoutW(
+        HWND_BROADCAST,
+        WM_SETTINGCHANGE,
+        0,
+        "Wallpaper",
+        SMTO_ABORTIFHUNG,
+        50,
+        ctypes.byref(result),
     )
 
 
@@ -86,6 +192,32 @@ def _get_current_wallpaper() -> Path | None:
         return None
 
 
+def _save_bmp_fast(img: Image.Image, path: str | Path) -> None:
+    """
+    Grava *img* como BMP 24bpp sem passar pelo encoder/plugin do Pillow.
+
+    Cabecalho de 54 bytes empacotado com struct + pixels crus em BGR
+    (altura negativa = top-down, linhas alinhadas a 4 bytes). Para os
+    frames de fade isso elimina a maquinaria de plugin do Pillow do
+    caminho quente — o formato e identico ao que o Windows espera.
+    """
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    w, h = img.size
+    stride = (w * 3 + 3) & ~3
+    pixels = img.tobytes("raw", "BGR", stride, 1)
+    # Escrita atomica (tmp + os.replace), como em image_utils._save_state:
+    # SystemParametersInfoW nunca enxerga um BMP parcialmente gravado.
+    tmp = str(path) + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(struct.pack("<2sIHHI", b"BM", 54 + len(pixels), 0, 0, 54))
+        f.write(struct.pack(
+            "<IiiHHIIiiII", 40, w, -h, 1, 24, 0, len(pixels), 2835, 2835, 0, 0,
+        ))
+        f.write(pixels)
+    os.replace(tmp, path)
+
+
 def _smoothstep(t: float) -> float:
     """Ease-in-out (Hermite) — curva suave que desacelera no inicio e no fim."""
     t = max(0.0, min(1.0, t))
@@ -95,6 +227,31 @@ def _smoothstep(t: float) -> float:
 _FADE_FRAMES = 12
 _FADE_DELAY  = 0.035  # ~0.42 s total (12 × 0.035)
 
+# Fingerprint do ultimo canvas aplicado nesta sessao — se o collage sorteia
+# as mesmas imagens, pula blends + gravacoes BMP e reaplica o arquivo atual.
+_last_canvas_fp: str | None = None
+
+# Wallpaper "antigo" ja decodificado/ajustado, chaveado por (path, mtime,
+# tamanho do canvas) — fades consecutivos partem do mesmo arquivo atual e
+# pulam decode + convert + resize. No maximo 2 entradas.
+_old_cache: dict[tuple[str, int, tuple[int, int]], Image.Image] = {}
+
+
+def _load_old_image(old_path: Path, size: tuple[int, int]) -> Image.Image:
+    key = (str(old_path), old_path.stat().st_mtime_ns, size)
+    old_img = _old_cache.get(key)
+    if old_img is not None:
+        return old_img
+    old_img = Image.open(old_path)
+    if old_img.mode != "RGB":
+        old_img = old_img.convert("RGB")
+    if old_img.size != size:
+        old_img = old_img.resize(size, Image.LANCZOS)
+    if len(_old_cache) >= 2:
+        _old_cache.clear()
+    _old_cache[key] = old_img
+    return old_img
+
 
 def _apply_or_fade(canvas: Image.Image, out: Path, fade_in: bool) -> None:
     """
@@ -102,66 +259,166 @@ def _apply_or_fade(canvas: Image.Image, out: Path, fade_in: bool) -> None:
 
     Se *fade_in* e True, gera uma transicao suave com:
       - Curva ease-in-out (smoothstep) para alpha natural
-      - Frames pre-gerados em disco antes da animacao
+      - Pipeline produtor/consumidor: o blend+gravacao do frame N+1 roda
+        em paralelo com a aplicacao/espera do frame N
       - _set_wallpaper_fast() nos frames intermediarios (sem broadcast
         WM_SETTINGCHANGE), eliminando o gargalo de ~100ms por frame
-      - Dois caminhos alternados para forcar o Windows a recarregar
+      - Tres caminhos rotativos para que o produtor nunca sobrescreva um
+        arquivo que o Windows ainda possa estar lendo
     """
+    global _last_canvas_fp  # noqa: PLW0603 (cache de modulo)
+    fp = hashlib.blake2b(canvas.tobytes(), digest_size=16).hexdigest()
+    if fp == _last_canvas_fp and out.exists():
+        set_wallpaper_win(out)
+        return
+    _last_canvas_fp = fp
+
     if not fade_in:
-        canvas.save(str(out), "BMP")
+        _save_bmp_fast(canvas, out)
         set_wallpaper_win(out)
         return
 
     old_path = _get_current_wallpaper()
     if old_path is None:
-        canvas.save(str(out), "BMP")
+        _save_bmp_fast(canvas, out)
         set_wallpaper_win(out)
         return
 
     try:
-        old_img = Image.open(old_path).convert("RGB")
-        if old_img.size != canvas.size:
-            old_img = old_img.resize(canvas.size, Image.LANCZOS)
+        old_img = _load_old_image(old_path, canvas.size)
     except Exception:
-        canvas.save(str(out), "BMP")
+        _save_bmp_fast(canvas, out)
         set_wallpaper_win(out)
         return
 
     fade_dir = out.parent
-    tmp_a = fade_dir / "_fade_a.bmp"
-    tmp_b = fade_dir / "_fade_b.bmp"
-    tmp_paths = (tmp_a, tmp_b)
-
-    # ── Pre-gerar todos os frames em disco ─────────────────────────────
-    frame_files: list[Path] = []
-    for i in range(1, _FADE_FRAMES + 1):
-        t = i / _FADE_FRAMES
-        alpha = _smoothstep(t)
-        frame = Image.blend(old_img, canvas, alpha)
-        dest = tmp_paths[i % 2]
-        frame.save(str(dest), "BMP")
-        frame_files.append(dest)
-
-    # ── Reproduzir animacao — apenas troca de caminho, sem I/O ─────────
+    tmp_paths = tuple(fade_dir / f"_fade_{s}.bmp" for s in ("a", "b", "c"))
+    # Caminhos absolutos resolvidos UMA vez — resolve() custa um par de
+    # syscalls (GetFullPathNameW/GetLongPathNameW) por chamada no Windows
+    tmp_abs = tuple(str(p.resolve()) for p in tmp_paths)
+
+    # ── Pipeline: produtor gera frames enquanto o consumidor aplica ────
+    # Fila limitada a 1 item + 3 caminhos rotativos: quando o produtor vai
+    # regravar um caminho, o consumidor ja aplicou o frame que o usava.
+    frames_q: queue.Queue[str | None] = queue.Queue(maxsize=1)
+
+    # Arquivos de rascunho mapeados em memoria (so no caminho numpy): criados
+    # uma vez no tamanho certo com o cabecalho ja gravado; por frame o blend
+    # escreve direto na regiao de pixels mapeada — zero open/write/close.
+    mms: list[mmap.mmap] = []
+    if _np is not None:
+        cw, ch = canvas.size
+        stride = (cw * 3 + 3) & ~3
+        nbytes = ch * stride
+        header = struct.pack("<2sIHHI", b"BM", 54 + nbytes, 0, 0, 54) + struct.pack(
+            "<IiiHHIIiiII", 40, cw, -ch, 1, 24, 0, nbytes, 2835, 2835, 0, 0,
+        )
+        for p in tmp_paths:
+            with open(p, "w+b") as f:
+                f.truncate(54 + nbytes)
+                mm = mmap.mmap(f.fileno(), 54 + nbytes)
+            mm[:54] = header
+            mms.append(mm)
+
+    producer_error: list[BaseException] = []
+
+    def _produce_frames() -> None:
+        try:
+            _generate_frames()
+        except BaseException as exc:  # re-levantada no consumidor apos o join
+            producer_error.append(exc)
+        finally:
+            # Sentinela SEMPRE enfileirada — sem ela, um erro no produtor
+            # (disco cheio, mm.flush) deixaria o consumidor bloqueado para
+            # sempre em frames_q.get()
+            frames_q.put(None)
+
+    def _generate_frames() -> None:
+        if _np is not None:
+            # Lerp inteiro vetorizado: old + (diff * w) >> 6, com w = alpha*64.
+            # Os arrays ja ficam em ordem BGR e o blend grava direto nas views
+            # mapeadas (linhas alinhadas a 4 bytes), sem objeto PIL por frame.
+            old_u8 = _np.asarray(old_img, dtype=_np.uint8)[:, :, ::-1]
+            new_u8 = _np.asarray(canvas, dtype=_np.uint8)[:, :, ::-1]
+            old_arr = old_u8.astype(_np.int16)
+            diff = new_u8.astype(_np.int16)
+            diff -= old_arr
+            # View (ch, cw, 3) com stride de linha alinhado — as_strided e
+            # necessario porque a fatia sem o padding nao e contigua
+            out_views = [
+                _np.lib.stride_tricks.as_strided(
+                    _np.frombuffer(mm, dtype=_np.uint8, count=nbytes, offset=54),
+                    shape=(ch, cw, 3),
+                    strides=(stride, 3, 1),
+                )
+                for mm in mms
+            ]
+            tmp16 = _np.empty(old_arr.shape, dtype=_np.int16)
+            for i in range(1, _FADE_FRAMES):
+                w = round(_smoothstep(i / _FADE_FRAMES) * 64)
+                dst = out_views[i % 3]
+                if w <= 0:
+                    # alpha ~0/~1: copia pura em vez de multiplicar+deslocar
+                    dst[...] = old_u8
+                elif w >= 64:
+                    dst[...] = new_u8
+                else:
+                    # Tres ufuncs com out= sobre buffers fixos: nenhum
+                    # temporario do tamanho do canvas e alocado no loop
+                    _np.multiply(diff, w, out=tmp16)
+                    _np.right_shift(tmp16, 6, out=tmp16)
+                    _np.add(old_arr, tmp16, out=dst, casting="unsafe")
+                mms[i % 3].flush()
+                frames_q.put(tmp_abs[i % 3])
+        else:
+            for i in range(1, _FADE_FRAMES):
+                alpha = _smoothstep(i / _FADE_FRAMES)
+                frame = Image.blend(old_img, canvas, alpha)
+                _save_bmp_fast(frame, tmp_paths[i % 3])
+                frames_q.put(tmp_abs[i % 3])
+
+    producer = threading.Thread(target=_produce_frames, daemon=True)
+    producer.start()
+
     # Configura o estilo span uma unica vez antes da animacao
     set_wallpaper_style_span()
-    for idx, fpath in enumerate(frame_files):
-        is_last = idx == len(frame_files) - 1
-        if is_last:
-            # Ultimo frame: gravar imagem final no destino real
-            canvas.save(str(out), "BMP")
-            set_wallpaper_win(out)
-        else:
-            _set_wallpaper_fast(fpath)
-            _time.sleep(_FADE_DELAY)
+    # Agenda de wake-ups em tempo absoluto: cada frame mira
+    # start + i*_FADE_DELAY, entao o custo do proprio frame e absorvido
+    # pela folga em vez de somar ao tempo total do fade.
+    start = time.perf_counter()
+    idx = 0
+    while True:
+        fpath = frames_q.get()
+        if fpath is None:
+            break
+        idx += 1
+        _set_wallpaper_fast(fpath)
+        remaining = start + idx * _FADE_DELAY - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+    producer.join()
+
+    if not producer_error:
+        # Ultimo frame: gravar imagem final no destino real, persistindo e
+        # com broadcast de prazo limitado — janela travada nao segura o fade
+        _save_bmp_fast(canvas, out)
+        _set_wallpaper_broadcast_async(out)
 
     # ── Limpeza dos arquivos temporarios ───────────────────────────────
+    for mm in mms:
+        try:
+            mm.close()
+        except Exception:
+            pass
     for f in tmp_paths:
         try:
             f.unlink()
         except Exception:
             pass
 
+    if producer_error:
+        raise producer_error[0]
+
 
 # ── Resolucao de pasta e estado ───────────────────────────────────────────────
 
@@ -196,29 +453,83 @@ _GRID_COLS: dict[int, int] = {
 }
 
 
-def _compute_grid_layout(n: int, w: int, h: int) -> list[tuple[int, int, int, int]]:
-    """
-    Divide a area w x h em n celulas usando grade dinamica adaptada ao aspecto.
-    Retorna lista de (x, y, cell_w, cell_h).
-    A ultima linha e centralizada quando tem menos celulas que as demais.
-    """
+def _build_grid_template(n: int) -> list[tuple[int, int, int, int]]:
+    """Posicoes logicas (coluna, linha, colunas_da_linha, linhas) para n celulas."""
     cols = _GRID_COLS.get(n, max(1, math.ceil(math.sqrt(n))))
     rows = math.ceil(n / cols)
-    cell_h = h // rows
-    cells: list[tuple[int, int, int, int]] = []
+    tmpl: list[tuple[int, int, int, int]] = []
     placed = 0
     for r in range(rows):
         row_cols = min(cols, n - placed)
-        cell_w = w // row_cols
-        offset_x = (w - row_cols * cell_w) // 2
         for c in range(row_cols):
-            cells.append((offset_x + c * cell_w, r * cell_h, cell_w, cell_h))
+            tmpl.append((c, r, row_cols, rows))
             placed += 1
-    return cells
+    return tmpl
+
+
+# Templates pre-computados para o caso quente (1-9 imagens por monitor);
+# outros n caem no _build_grid_template sob demanda.
+_GRID_TEMPLATES: dict[int, list[tuple[int, int, int, int]]] = {
+    n: _build_grid_template(n) for n in range(1, 10)
+}
+
+
+@lru_cache(maxsize=64)
+def _compute_grid_layout(
+    n: int, w: int, h: int,
+) -> tuple[tuple[int, int, int, int], ...]:
+    """
+    Divide a area w x h em n celulas usando grade dinamica adaptada ao aspecto.
+    Retorna tupla de (x, y, cell_w, cell_h) — memoizada: a funcao e pura e o
+    espaco de chaves (n, resolucao do monitor) e minusculo por usuario.
+    A ultima linha e centralizada quando tem menos celulas que as demais.
+    """
+    tmpl = _GRID_TEMPLATES.get(n)
+    if tmpl is None:
+        tmpl = _GRID_TEMPLATES.setdefault(n, _build_grid_template(n))
+    # So restam multiplicacoes/divisoes inteiras parametrizadas por (w, h)
+    return tuple(
+        (
+            (w - row_cols * (w // row_cols)) // 2 + c * (w // row_cols),
+            r * (h // rows),
+            w // row_cols,
+            h // rows,
+        )
+        for c, r, row_cols, rows in tmpl
+    )
+
+
+# ── Cache de tiles ajustados ─────────────────────────────────────────────────
+
+# Tiles ja decodificados + ajustados, compartilhados entre aplicacoes — chave
+# (caminho, mtime_ns, largura, altura, modo). Quando a rotacao sorteia uma
+# imagem repetida para a mesma celula, decode e LANCZOS sao pulados inteiros.
+_tile_cache: OrderedDict[tuple[str, int, int, int, str], Image.Image] = OrderedDict()
+_TILE_CACHE_MAX = 32
+
+
+def _tile_key(path: Path, w: int, h: int, mode: str) -> tuple[str, int, int, int, str]:
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        mtime = 0
+    return (str(path), mtime, w, h, mode)
+
+
+def _tile_store(key: tuple[str, int, int, int, str], img: Image.Image) -> None:
+    _tile_cache[key] = img
+    while len(_tile_cache) > _TILE_CACHE_MAX:
+        _tile_cache.popitem(last=False)
 
 
 # ── Collage ───────────────────────────────────────────────────────────────────
 
+# Assinatura (imagens + geometria + opcoes) do ultimo collage montado — se a
+# selecao repete tudo, o rebuild inteiro (decode/fit/paste/save) e pulado
+# antes mesmo de comecar; o fingerprint de canvas so pega o caso tardio.
+_last_collage_sig: tuple | None = None
+
+
 def _apply_collage(
     cfg: dict,
     monitors: list[Monitor],
@@ -245,25 +556,90 @@ def _apply_collage(
     else:
         imgs = pick_images(str(folder), count * len(monitors), selection, sf)
 
+    global _last_collage_sig  # noqa: PLW0603 (cache de modulo)
+    out = output_dir / "wallpaper_collage.bmp"
+    sig = (
+        tuple(str(p) for p in imgs),
+        tuple(monitors),
+        fit_mode,
+        count,
+        same_for_all,
+    )
+    if sig == _last_collage_sig and out.exists():
+        set_wallpaper_win(out)
+        return out, [str(p) for p in imgs]
+
     min_x, min_y, total_w, total_h = get_virtual_desktop(monitors)
     canvas = build_canvas(total_w, total_h)
 
+    # Primeira passada: so enumera as celulas, consulta o cache de tiles e o
+    # hint de draft de cada arquivo que ainda precisa de decode. So os
+    # arquivos com alguma celula fora do cache sao decodificados — em
+    # paralelo num pool (libjpeg/libpng soltam o GIL); fit e paste continuam
+    # seriais — fit_image pode devolver o canvas compartilhado de image_utils.
     img_idx = 0
+    placements: list[
+        tuple[tuple[str, int, int, int, str], Path, int, int, int, int]
+    ] = []
+    hints: dict[Path, tuple[int, int]] = {}
     for mon in monitors:
         cells = _compute_grid_layout(count, mon.width, mon.height)
         for j, (cell_x, cell_y, cell_w, cell_h) in enumerate(cells):
-            src_idx = j if same_for_all else img_idx
-            img = Image.open(imgs[src_idx]).convert("RGB")
-            img = fit_image(img, cell_w, cell_h, fit_mode)
-            paste_x = (mon.x - min_x) + cell_x
-            paste_y = (mon.y - min_y) + cell_y
-            canvas.paste(img, (paste_x, paste_y))
+            src = imgs[j if same_for_all else img_idx]
+            tkey = _tile_key(src, cell_w, cell_h, fit_mode)
+            placements.append((
+                tkey,
+                src,
+                (mon.x - min_x) + cell_x,
+                (mon.y - min_y) + cell_y,
+                cell_w,
+                cell_h,
+            ))
+            if tkey not in _tile_cache:
+                # Para JPEGs, decodifica ja reduzido via escala DCT —
+                # 2x a celula preserva folga para o LANCZOS final
+                hints.setdefault(src, (cell_w * 2, cell_h * 2))
             if not same_for_all:
                 img_idx += 1
 
-    out = output_dir / "wallpaper_collage.bmp"
-    canvas.save(str(out), "BMP")
+    def _decode(path: Path, hint: tuple[int, int]) -> Image.Image:
+        src = Image.open(path)
+        src.draft("RGB", hint)
+        if src.mode != "RGB":
+            return src.convert("RGB")
+        src.load()
+        return src
+
+    if len(hints) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(len(hints), os.cpu_count() or 4),
+        ) as ex:
+            decoded = dict(zip(hints, ex.map(_decode, hints, hints.values())))
+    else:
+        decoded = {p: _decode(p, h) for p, h in hints.items()}
+
+    for tkey, src, paste_x, paste_y, cell_w, cell_h in placements:
+        img = _tile_cache.get(tkey)
+        if img is None:
+            # O arquivo pode nao ter sido decodificado: a celula era hit na
+            # primeira passada mas foi despejada do LRU por um _tile_store
+            # anterior (builds com mais celulas que _TILE_CACHE_MAX).
+            src_img = decoded.get(src)
+            if src_img is None:
+                src_img = decoded[src] = _decode(src, (cell_w * 2, cell_h * 2))
+            img = fit_image(src_img, cell_w, cell_h, fit_mode)
+            if fit_mode == "center":
+                # center devolve o canvas compartilhado de image_utils;
+                # copia antes de reter no cache
+                img = img.copy()
+            _tile_store(tkey, img)
+        else:
+            _tile_cache.move_to_end(tkey)
+        canvas.paste(img, (paste_x, paste_y))
+
+    _save_bmp_fast(canvas, out)
     set_wallpaper_win(out)
+    _last_collage_sig = sig
     return out, [str(p) for p in imgs]
 
 
@@ -276,16 +652,41 @@ def apply_single_wallpaper(
     fit_mode: str = "fill",
 ) -> Path:
     """Apply a single image as wallpaper across all monitors."""
-    img = Image.open(str(image_path)).convert("RGB")
+    image_path = Path(image_path)
     min_x, min_y, total_w, total_h = get_virtual_desktop(monitors)
     canvas = build_canvas(total_w, total_h)
+    # O decode e adiado: se todos os monitores acertam o cache de tiles
+    # (ex.: hotkey de wallpaper padrao repetida), o arquivo nem e aberto
+    img: Image.Image | None = None
     for mon in monitors:
-        fitted = fit_image(img, mon.width, mon.height, fit_mode)
+        tkey = _tile_key(image_path, mon.width, mon.height, fit_mode)
+        fitted = _tile_cache.get(tkey)
+        if fitted is None:
+            if img is None:
+                img = Image.open(str(image_path))
+                # Para JPEGs, decodifica ja reduzido via escala DCT — 2x o
+                # maior monitor preserva folga para o LANCZOS final
+                img.draft("RGB", (
+                    max(m.width for m in monitors) * 2,
+                    max(m.height for m in monitors) * 2,
+                ))
+                # JPEGs ja decodificam em RGB — o convert so roda (e copia a
+                # imagem inteira) quando o modo de origem e outro
+                if img.mode != "RGB":
+                    img = img.convert("RGB")
+            fitted = fit_image(img, mon.width, mon.height, fit_mode)
+            if fit_mode == "center":
+                # center devolve o canvas compartilhado de image_utils;
+                # copia antes de reter no cache
+                fitted = fitted.copy()
+            _tile_store(tkey, fitted)
+        else:
+            _tile_cache.move_to_end(tkey)
         paste_x = mon.x - min_x
         paste_y = mon.y - min_y
         canvas.paste(fitted, (paste_x, paste_y))
     out = output_dir / "wallpaper_default.bmp"
-    canvas.save(str(out), "BMP")
+    _save_bmp_fast(canvas, out)
     set_wallpaper_win(out)
     return out
 
@@ -28,6 +28,10 @@ hidden = [
     "pywintypes",
     "tomllib",
     "ctypes.wintypes",
+    # Importados via importlib em i18n._load — invisiveis para a analise
+    # estatica do PyInstaller
+    "wallpaper_changer.i18n_pt_BR",
+    "wallpaper_changer.i18n_ja",
 ]
 
 # ── Analise de codigo ─────────────────────────────────────────────────────────